@@ -12,24 +12,34 @@ A spiritual successor to my now-obsolete Albix Player, continuing its legacy wit
 import sys
 sys.dont_write_bytecode = True
 import os
+import functools
 import json
 import random
+import re
 import time
+from contextlib import contextmanager
 from os.path import basename, splitext
 from theme import *
 import generic_player_mpris
 import generic_player_lyrics
 
+# Optional fast JSON encoder for playlists (falls back to stdlib json)
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
 # ---------------- PyQt6 first, fallback to PyQt5 ----------------
 USING_QT6 = False
 try:
     from PyQt6 import QtCore, QtGui, QtWidgets
     from PyQt6.QtCore import Qt, QUrl, QSize
-    from PyQt6.QtGui import QIcon, QAction, QKeySequence
+    from PyQt6.QtGui import QIcon, QAction, QKeySequence, QShortcut
     from PyQt6.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
         QListWidget, QFileDialog, QSlider, QAbstractItemView, QMessageBox, QLabel,
-        QTabWidget, QLineEdit, QStatusBar, QMenuBar, QComboBox
+        QTabWidget, QLineEdit, QStatusBar, QMenuBar, QComboBox, QProgressBar
     )
     from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
     from PyQt6.QtMultimediaWidgets import QVideoWidget
@@ -43,33 +53,82 @@ except Exception as e:
     from PyQt5.QtWidgets import (
         QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
         QListWidget, QFileDialog, QSlider, QAbstractItemView, QMessageBox, QLabel,
-        QTabWidget, QLineEdit, QStatusBar, QMenuBar, QComboBox, QAction
+        QTabWidget, QLineEdit, QStatusBar, QMenuBar, QComboBox, QAction, QShortcut,
+        QProgressBar
     )
     from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
     from PyQt5.QtMultimediaWidgets import QVideoWidget
     USING_QT6 = False
     print("Using PyQt5")
 
-# ---------------- Cross-version helpers ----------------
-def align_center():
-    return Qt.AlignmentFlag.AlignCenter if USING_QT6 else Qt.AlignCenter
-
-def key(name: str):
-    return getattr(Qt.Key, name) if USING_QT6 else getattr(Qt, name)
-
-def file_dialog_options(use_native: bool = False):
-    if USING_QT6:
-        opt = QtWidgets.QFileDialog.Option(0)
-        if not use_native:
-            opt |= QtWidgets.QFileDialog.Option.DontUseNativeDialog
-        return opt
-    else:
-        opt = QFileDialog.Options()
-        if not use_native:
-            opt |= QFileDialog.DontUseNativeDialog
-        return opt
+# ---------------- Cross-version constants (resolved once) ----------------
+if USING_QT6:
+    ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+    ORIENT_H = Qt.Orientation.Horizontal
+    SHORTCUT_APP = Qt.ShortcutContext.ApplicationShortcut
+    PRECISE_TIMER = Qt.TimerType.PreciseTimer
+    SEL_EXTENDED = QAbstractItemView.SelectionMode.ExtendedSelection
+    KEY = Qt.Key
+    CTRL_MOD = Qt.KeyboardModifier.ControlModifier
+    END_OF_MEDIA = QMediaPlayer.MediaStatus.EndOfMedia
+    PLAYING_STATE = QMediaPlayer.PlaybackState.PlayingState
+    PAUSED_STATE = QMediaPlayer.PlaybackState.PausedState
+    STOPPED_STATE = QMediaPlayer.PlaybackState.StoppedState
+    # Non-native (Qt) file dialogs
+    FILE_DIALOG_OPTIONS = QFileDialog.Option(0) | QFileDialog.Option.DontUseNativeDialog
+else:
+    ALIGN_CENTER = Qt.AlignCenter
+    ORIENT_H = Qt.Horizontal
+    SHORTCUT_APP = Qt.ApplicationShortcut
+    PRECISE_TIMER = Qt.PreciseTimer
+    SEL_EXTENDED = QAbstractItemView.ExtendedSelection
+    KEY = Qt
+    CTRL_MOD = Qt.ControlModifier
+    END_OF_MEDIA = QMediaPlayer.EndOfMedia
+    PLAYING_STATE = QMediaPlayer.PlayingState
+    PAUSED_STATE = QMediaPlayer.PausedState
+    STOPPED_STATE = QMediaPlayer.StoppedState
+    FILE_DIALOG_OPTIONS = QFileDialog.Options() | QFileDialog.DontUseNativeDialog
+
+# Keys looked up on every key press, resolved once (None if this Qt lacks one)
+KEYS = {name: getattr(KEY, name, None) for name in (
+    "Key_Space", "Key_MediaPlay", "Key_MediaPause", "Key_MediaTogglePlayPause",
+    "Key_MediaNext", "Key_MediaPrevious", "Key_MediaStop",
+)}
+KEY_SPACE = KEYS["Key_Space"]
+KEY_MEDIA_PLAY = KEYS["Key_MediaPlay"]
+KEY_MEDIA_PAUSE = KEYS["Key_MediaPause"]
+KEY_MEDIA_TOGGLE = KEYS["Key_MediaTogglePlayPause"]
+KEY_F11 = KEY.Key_F11
+KEY_ESCAPE = KEY.Key_Escape
+KEY_L = KEY.Key_L
+
+# Play/pause shortcuts: (key, application-wide?). Space stays window-scoped.
+PLAY_PAUSE_KEYS = tuple((k, app_wide) for k, app_wide in (
+    (KEY_SPACE, False),
+    (KEY_MEDIA_TOGGLE, True),
+    (KEY_MEDIA_PLAY, True),
+    (KEY_MEDIA_PAUSE, True),
+) if k is not None)
+
+def key_sequence(k) -> QKeySequence:
+    """QKeySequence for a single key code (Qt6 needs a QKeyCombination)."""
+    return QKeySequence(QtCore.QKeyCombination(k)) if USING_QT6 else QKeySequence(k)
+
+@contextmanager
+def suspended(widget):
+    """Suspend repaints and signals of a widget during bulk mutations."""
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield widget
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
 
+@functools.lru_cache(maxsize=1)
 def _is_wayland() -> bool:
+    """Session type is fixed for the process; only call once QApplication exists."""
     try:
         plat = QtWidgets.QApplication.platformName()
     except Exception:
@@ -95,6 +154,8 @@ class AnimatedButton(QtWidgets.QPushButton):
     """Button that can optionally override hover styling.
 
     By default, the active ThemeManager QSS controls all button states.
+    Overrides are set once as a :hover rule, so Qt's style engine handles
+    hover without per-event Python work.
     """
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -102,24 +163,94 @@ class AnimatedButton(QtWidgets.QPushButton):
         self._hover_qss = ""
 
     def apply_button_qss(self, default_qss: str = "", hover_qss: str = ""):
+        """Set default/hover declarations (e.g. "color: red;") for this button."""
         self._default_qss = default_qss or ""
         self._hover_qss = hover_qss or ""
-        self.setStyleSheet(self._default_qss or "")
-
-    def enterEvent(self, e):
+        qss = ""
+        if self._default_qss:
+            qss += f"QPushButton {{ {self._default_qss} }}\n"
         if self._hover_qss:
-            self.setStyleSheet(self._hover_qss)
-        super().enterEvent(e)
+            qss += f"QPushButton:hover {{ {self._hover_qss} }}\n"
+        self.setStyleSheet(qss)
+
+
+# MPRIS notification bits (see MainWindow._mpris_notify)
+_MPRIS_PLAYBACK = 1
+_MPRIS_METADATA = 2
 
-    def leaveEvent(self, e):
-        self.setStyleSheet(self._default_qss or "")
-        super().leaveEvent(e)
+# ---------------- Background metadata ----------------
+# Bump when _build_media_meta changes so metadata cached in playlists is refreshed.
+META_VERSION = 2
+
+# "Artist - Title" style filenames, one pattern per separator in priority
+# order (em dash, hyphen, en dash, "_-"); the first separator type present wins
+_ARTIST_TITLE_RES = tuple(
+    re.compile(r"^(.*?)" + re.escape(sep) + r"(.*)$", re.S)
+    for sep in (" — ", " - ", " – ", "_-")
+)
+
+
+class _MetaSignals(QtCore.QObject):
+    """Carries background metadata results back to the GUI thread."""
+    ready = QtCore.pyqtSignal(object)  # list of (path, meta dict)
+
+
+class _MetaJob(QtCore.QRunnable):
+    """Read media metadata for a batch of (path, mtype) entries off the UI thread."""
+    CHUNK = 64
+
+    def __init__(self, build_meta, signals: _MetaSignals, entries):
+        super().__init__()
+        self._build_meta = build_meta
+        self._signals = signals
+        self._entries = entries
+
+    def run(self):
+        batch = []
+        for path, mtype in self._entries:
+            try:
+                batch.append((path, self._build_meta(path, mtype)))
+            except Exception:
+                continue
+            if len(batch) >= self.CHUNK:
+                self._signals.ready.emit(batch)
+                batch = []
+        if batch:
+            self._signals.ready.emit(batch)
+
+
+class _PlaylistSignals(QtCore.QObject):
+    """Carries a background playlist load back to the GUI thread."""
+    loaded = QtCore.pyqtSignal(str, object)  # file name, parsed JSON
+    failed = QtCore.pyqtSignal(str, str)     # file name, error text
+
+
+class _PlaylistLoadJob(QtCore.QRunnable):
+    """Read and parse a playlist file off the UI thread."""
+
+    def __init__(self, file_name: str, signals: _PlaylistSignals):
+        super().__init__()
+        self._file_name = file_name
+        self._signals = signals
+
+    def run(self):
+        try:
+            with open(self._file_name, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+        except Exception as e:
+            self._signals.failed.emit(self._file_name, str(e))
+            return
+        self._signals.loaded.emit(self._file_name, data)
 
 
 # ---------------- Main Window ----------------
 class MainWindow(QMainWindow):
     SUPPORTED_VIDEO_EXTENSIONS = {".mp4", ".avi", ".mkv", ".mov", ".wmv"}
     SUPPORTED_AUDIO_EXTENSIONS = {".mp3", ".ogg", ".flac", ".wav"}
+    # Lowercase extension (no dot) -> media type, for a single lookup per file
+    EXT_TO_TYPE = {e[1:]: "video" for e in SUPPORTED_VIDEO_EXTENSIONS}
+    EXT_TO_TYPE.update({e[1:]: "audio" for e in SUPPORTED_AUDIO_EXTENSIONS})
 
     def __init__(self):
         super().__init__()
@@ -129,8 +260,10 @@ class MainWindow(QMainWindow):
         self.setGeometry(100, 100, 1000, 700)
         self.setAcceptDrops(True)
 
-        # Last played state 
+        # Last playback state, maintained by the state-change adapters
         self._last_playing = False
+        self._last_paused = False
+        self._applied_state = None  # last state handled by _apply_playback_state
 
 
         # Last playing flag used when backend state lags (media keys / MPRIS)
@@ -138,30 +271,78 @@ class MainWindow(QMainWindow):
 
         # UI throttles (reduce label/slider churn)
         self._last_ui_second = -1
-        self._last_slider_update_ms = -999999
+        self._clock_cache = {}  # whole seconds -> "HH:MM:SS"
+
+        # Position movement (see _is_effectively_playing)
+        self._last_pos_ms = -1
+        self._last_pos_moved_at = 0.0
+
+        # positionChanged coalescing: keep the latest position and flush it
+        # to the slider/clock/lyrics at most every 250 ms
+        self._pending_pos_ms = 0
+        self._pos_flush_timer = QtCore.QTimer(self)
+        self._pos_flush_timer.setSingleShot(True)
+        self._pos_flush_timer.setTimerType(PRECISE_TIMER)
+        self._pos_flush_timer.timeout.connect(self._flush_position)
         # Playlist & state
         self.playlist = []
+        self._path_index = set()  # paths in self.playlist, for O(1) dedup
+        self._stream_urls = set()  # stream URLs in self.playlist
+        self._url_cache = {}      # local path -> QUrl, built on first play
         self.current_song_index = -1
         self.shuffle_mode = False
         self.repeat_mode = False
         self.current_media_type = 'audio'
         self._lyrics_visible = False
 
-        # Track-end watchdog
+        # Track end (advance on mediaStatusChanged == EndOfMedia)
         self._duration_ms = 0
-        self._end_guard = False
+        self._advancing = False
 
         # Debounce guard for play/pause toggles (prevents double-toggle from key+MPRIS)
         self._toggle_guard_until = 0.0
 
+        # Background metadata reads (tags) report back through this object
+        self._meta_signals = _MetaSignals(self)
+        self._meta_signals.ready.connect(self._on_meta_ready)
+
+        # Background playlist loading
+        self._playlist_loading = False
+        self._playlist_signals = _PlaylistSignals(self)
+        self._playlist_signals.loaded.connect(self._on_playlist_loaded)
+        self._playlist_signals.failed.connect(self._on_playlist_load_failed)
+
+        # Slider drags seek the backend at most every ~50 ms (latest position wins)
+        self._seek_pending = None
+        self._seek_timer = QtCore.QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(50)
+        self._seek_timer.timeout.connect(self._do_seek)
+
+        # Status messages from sliders/toggles: at most one repaint per ~100 ms
+        self._status_pending = None
+        self._status_timer = QtCore.QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(100)
+        self._status_timer.timeout.connect(self._flush_status)
+
         # ---- MPRIS / playerctl support ----
+        # Change notifications are coalesced and flushed at most every ~60 ms
+        self._mpris_pending = 0
+        # What was last broadcast, so unchanged state/metadata is not re-sent
+        self._mpris_sent_playback = None
+        self._mpris_sent_metadata = None
+        self._mpris_kick = QtCore.QTimer(self)
+        self._mpris_kick.setSingleShot(True)
+        self._mpris_kick.setInterval(60)
+        self._mpris_kick.timeout.connect(self._mpris_flush)
+
         self.mpris = None
         try:
             self.mpris = generic_player_mpris.GenericPlayerMPRIS(self)
-            # Drive GLib/DBus from Qt without blocking
-            self._mpris_timer = QtCore.QTimer(self)
-            self._mpris_timer.timeout.connect(self.mpris.poll)
-            self._mpris_timer.start(80)
+            # DBus is dispatched by Qt's GLib event loop; start() only falls
+            # back to polling when Qt runs without GLib integration.
+            self.mpris.start()
         except Exception as e:
             self.mpris = None
             print("MPRIS disabled:", e)
@@ -204,6 +385,14 @@ class MainWindow(QMainWindow):
         # Fullscreen UI state
         self._fs_saved_tab_max_h = None
         self._fs_saved_tabbar_visible = True
+        # Widgets hidden in fullscreen (everything but the video)
+        self._fs_widgets = (
+            self.playlist_widget, self.play_button, self.stop_button, self.mute_button,
+            self.add_button, self.prev_button, self.next_button, self.remove_button,
+            self.shuffle_button, self.repeat_button, self.tab_widget, self.lyrics_button,
+            self.playback_slider, self.theme_combo, self.volume_slider,
+            self.total_time_label, self.current_time_label, self.menuBar(),
+        )
 
         # ---- Lyrics integration (show/hide only) ----
         try:
@@ -216,11 +405,20 @@ class MainWindow(QMainWindow):
         # Initialize volume to slider value
         self.change_volume(self.volume_slider.value())
 
-        # Global key handling (Alt+P, Space, Media keys)
+        # Space / media keys as Qt shortcuts rather than an app-wide event
+        # filter, so ordinary events never detour through Python. Text fields
+        # keep Space for typing: QLineEdit claims it via ShortcutOverride.
+        self._play_pause_shortcuts = []
         try:
-            QtWidgets.QApplication.instance().installEventFilter(self)
-        except Exception:
-            pass
+            for k, app_wide in PLAY_PAUSE_KEYS:
+                sc = QShortcut(key_sequence(k), self)
+                if app_wide:
+                    sc.setContext(SHORTCUT_APP)
+                sc.setAutoRepeat(False)
+                sc.activated.connect(self._toggle_play_pause_shortcut)
+                self._play_pause_shortcuts.append(sc)
+        except Exception as e:
+            print("Play/pause shortcuts disabled:", e)
 
         # Application-level shortcut: Alt+P (toggle)
         try:
@@ -228,10 +426,7 @@ class MainWindow(QMainWindow):
             self._toggle_action.setShortcut(QKeySequence("Alt+P"))
 
             # Make sure Alt+P works app-wide and fires ONLY once
-            self._toggle_action.setShortcutContext(
-                Qt.ShortcutContext.ApplicationShortcut
-                if USING_QT6 else Qt.ApplicationShortcut
-            )
+            self._toggle_action.setShortcutContext(SHORTCUT_APP)
             self._toggle_action.setAutoRepeat(False)
             self._toggle_action.activated.connect(self._toggle_play_pause_shortcut)
         except Exception:
@@ -253,21 +448,35 @@ class MainWindow(QMainWindow):
             super().dropEvent(event)
 
     def _process_dropped_files(self, files):
+        items = []
+        added = set()
+        pending = []
+        ext_to_type = self.EXT_TO_TYPE
         for file_path in files:
-            ext = splitext(file_path)[1].lower()
-            if ext in self.SUPPORTED_VIDEO_EXTENSIONS:
-                mtype = "video"
-            elif ext in self.SUPPORTED_AUDIO_EXTENSIONS:
-                mtype = "audio"
-            else:
+            mtype = ext_to_type.get(file_path.rpartition(".")[2].lower())
+            if mtype is None or file_path in self._path_index or file_path in added:
                 continue
             if not os.path.exists(file_path):
                 continue
-            if any(it.get("path") == file_path for it in self.playlist):
-                continue
-            meta = self._build_media_meta(file_path, mtype)
-            self.playlist.append({"path": file_path, "type": mtype, **meta})
-            self.playlist_widget.addItem(meta.get("display") or basename(file_path))
+            # Filename placeholder now; tags are read on the thread pool
+            meta = self._build_media_meta(file_path, mtype, read_tags=False)
+            items.append({"path": file_path, "type": mtype, **meta})
+            added.add(file_path)
+            if "meta_version" not in meta:
+                pending.append((file_path, mtype))
+        self._append_playlist_items(items)
+        self._refresh_meta_async(pending)
+
+    def _append_playlist_items(self, items):
+        """Append playlist entries and their rows in one batched widget update."""
+        if items:
+            with suspended(self.playlist_widget):
+                self.playlist_widget.addItems(
+                    [it.get("display") or it.get("title") or basename(it["path"]) for it in items]
+                )
+            self.playlist.extend(items)
+            self._path_index.update(it["path"] for it in items)
+            self._stream_urls.update(it["path"] for it in items if it.get("type") == "stream")
         self._update_controls_enabled()
 
 # Toggle guard
@@ -299,23 +508,13 @@ class MainWindow(QMainWindow):
 
         status = "Stopped"
         try:
-            if USING_QT6:
-                from PyQt6.QtMultimedia import QMediaPlayer as QMP
-                st = self.player.playbackState()
-                if st == QMP.PlaybackState.PlayingState:
-                    status = "Playing"
-                elif st == QMP.PlaybackState.PausedState:
-                    status = "Paused"
-                else:
-                    status = "Stopped"
+            st = self.player.playbackState() if USING_QT6 else self.player.state()
+            if st == PLAYING_STATE:
+                status = "Playing"
+            elif st == PAUSED_STATE:
+                status = "Paused"
             else:
-                st = self.player.state()
-                if st == QMediaPlayer.State.PlayingState:
-                    status = "Playing"
-                elif st == QMediaPlayer.State.PausedState:
-                    status = "Paused"
-                else:
-                    status = "Stopped"
+                status = "Stopped"
         except Exception:
             # Fallback: use your existing helper if Qt query fails
             try:
@@ -421,14 +620,13 @@ class MainWindow(QMainWindow):
 
         # Slider + time
         s_layout = QHBoxLayout()
-        s_layout.setAlignment(align_center())
+        s_layout.setAlignment(ALIGN_CENTER)
 
         self.current_time_label = QLabel("00:00:00")
         self.current_time_label.setObjectName("elapsed_clock")
-        self.current_time_label.setStyleSheet("font-family: monospace; font-size: 14px;")
         s_layout.addWidget(self.current_time_label)
 
-        self.playback_slider = QSlider(Qt.Orientation.Horizontal if USING_QT6 else Qt.Horizontal)
+        self.playback_slider = QSlider(ORIENT_H)
         self.playback_slider.setRange(0, 0)
         self.playback_slider.sliderMoved.connect(self.seek_position)
         self.playback_slider.setEnabled(False)
@@ -436,37 +634,43 @@ class MainWindow(QMainWindow):
 
         self.total_time_label = QLabel("00:00:00")
         self.total_time_label.setObjectName("total_clock")
-        self.total_time_label.setStyleSheet("font-family: monospace; font-size: 14px;")
         s_layout.addWidget(self.total_time_label)
 
         main_layout.addLayout(s_layout)
 
         # Volume + mute
         v_layout = QHBoxLayout()
-        v_layout.setAlignment(align_center())
+        v_layout.setAlignment(ALIGN_CENTER)
 
         self.mute_button = AnimatedButton("Mute")
         self.mute_button.setCheckable(True)
         self.mute_button.clicked.connect(self.toggle_mute)
         v_layout.addWidget(self.mute_button)
 
-        self.volume_slider = QSlider(Qt.Orientation.Horizontal if USING_QT6 else Qt.Horizontal)
+        self.volume_slider = QSlider(ORIENT_H)
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(70)
         self.volume_slider.setFixedWidth(150)
         self.volume_slider.valueChanged.connect(self.change_volume)
         v_layout.addWidget(self.volume_slider)
 
-        # Theme switcher
+        # Theme switcher (debounced: arrow-key scrolling through the combo
+        # applies/saves only the theme it settles on)
+        self._pending_theme = None
+        self._theme_debounce = QtCore.QTimer(self)
+        self._theme_debounce.setSingleShot(True)
+        self._theme_debounce.setInterval(200)
+        self._theme_debounce.timeout.connect(self._apply_pending_theme)
+
         self.theme_combo = QComboBox(self)
-        self.theme_combo.addItems(ThemeManager.themes())
+        self.theme_combo.addItems(list(ThemeManager.themes()))
         try:
             idx = self.theme_combo.findText(getattr(self, "_current_theme", ThemeManager.DEFAULT_THEME))
             if idx >= 0:
                 self.theme_combo.setCurrentIndex(idx)
         except Exception:
             pass
-        self.theme_combo.currentTextChanged.connect(self.apply_theme)
+        self.theme_combo.currentTextChanged.connect(self._queue_theme)
         v_layout.addWidget(self.theme_combo)
 
         main_layout.addLayout(v_layout)
@@ -475,6 +679,13 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar(self)
         self.setStatusBar(self.status_bar)
 
+        # Busy indicator while a playlist is parsed in the background
+        self.load_progress = QProgressBar(self)
+        self.load_progress.setRange(0, 0)
+        self.load_progress.setMaximumWidth(120)
+        self.load_progress.hide()
+        self.status_bar.addPermanentWidget(self.load_progress)
+
         # File menu 
         menubar = self.menuBar()
         file_menu = menubar.addMenu("File")
@@ -567,6 +778,13 @@ class MainWindow(QMainWindow):
         self.repeat_button.setEnabled(False)
         row2.addWidget(self.repeat_button)
 
+        # Buttons that need a non-empty playlist (all created disabled above)
+        self._control_buttons = (
+            self.play_button, self.remove_button, self.prev_button,
+            self.next_button, self.shuffle_button, self.repeat_button,
+        )
+        self._controls_enabled = False
+
         self.lyrics_button = AnimatedButton("Lyrics")
         self.lyrics_button.setCheckable(True)
         self.lyrics_button.clicked.connect(self.toggle_lyrics)
@@ -576,15 +794,8 @@ class MainWindow(QMainWindow):
 
         # Playlist
         self.playlist_widget = QListWidget(self.music_tab)
-        sel_mode = QAbstractItemView.SelectionMode.ExtendedSelection if USING_QT6 else QAbstractItemView.ExtendedSelection
-        self.playlist_widget.setSelectionMode(sel_mode)
+        self.playlist_widget.setSelectionMode(SEL_EXTENDED)
         self.playlist_widget.itemDoubleClicked.connect(self.play_selected_song)
-        self.playlist_widget.setStyleSheet("""
-            QListWidget::item {
-                padding: 10px;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(self.playlist_widget)
 
         # Custom station row (moved here, to the bottom of the Local Files UI)
@@ -602,16 +813,43 @@ class MainWindow(QMainWindow):
         layout.addLayout(row)
 
     # ---------------- Theme ----------------
+    def _queue_theme(self, theme_name: str):
+        """Remember the combo's theme and (re)arm the debounce timer."""
+        self._pending_theme = theme_name
+        self._theme_debounce.start()
+
+    def _apply_pending_theme(self):
+        name, self._pending_theme = self._pending_theme, None
+        if name:
+            self.apply_theme(name)
+
     def apply_theme(self, theme_name: str):
         """Apply a named theme (and persist it)."""
         theme_name = (theme_name or ThemeManager.DEFAULT_THEME).strip()
         if theme_name not in ThemeManager.themes():
             theme_name = ThemeManager.DEFAULT_THEME
 
+        # setStyleSheet() re-polishes every widget; skip it when nothing changed
+        previous = getattr(self, "_current_theme", None)
+        if theme_name == previous and getattr(self, "_qss_applied", False):
+            # Re-clicking the checkable active action unchecks it: re-sync only
+            self._sync_theme_controls(theme_name)
+            return
+
         self._current_theme = theme_name
         self.setStyleSheet(ThemeManager.qss(theme_name))
+        self._qss_applied = True
+        self._sync_theme_controls(theme_name)
 
-        # Keep UI controls in sync
+        if theme_name != previous:
+            ThemeManager.save_theme(theme_name)
+        try:
+            self._show_status(f"Theme: {theme_name}")
+        except Exception:
+            pass
+
+    def _sync_theme_controls(self, theme_name: str):
+        """Keep the theme combo and menu actions in sync with theme_name."""
         try:
             if hasattr(self, "theme_combo") and self.theme_combo is not None:
                 idx = self.theme_combo.findText(theme_name)
@@ -629,53 +867,83 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        ThemeManager.save_theme(theme_name)
-        try:
-            self.status_bar.showMessage(f"Theme: {theme_name}")
-        except Exception:
-            pass
-
         # ---------------- Menu actions ----------------
     def save_playlist(self):
         if not self.playlist:
             QMessageBox.information(self, "Empty Playlist", "There is no playlist to save.")
             return
-        opts = file_dialog_options(False)
+        opts = FILE_DIALOG_OPTIONS
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Playlist", "", "JSON Files (*.json)", options=opts)
         if file_name:
+            # Write to a temp file and rename so a crash never leaves a truncated playlist
+            tmp = file_name + ".tmp"
             try:
-                with open(file_name, 'w', encoding='utf-8') as f:
-                    json.dump(self.playlist, f, indent=4)
+                if _HAVE_ORJSON:
+                    with open(tmp, 'wb') as f:
+                        f.write(orjson.dumps(self.playlist, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(tmp, 'w', encoding='utf-8') as f:
+                        json.dump(self.playlist, f, indent=4)
+                os.replace(tmp, file_name)
                 QMessageBox.information(self, "Playlist Saved", f"Playlist saved to {file_name}")
             except Exception as e:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
                 QMessageBox.critical(self, "Error Saving Playlist", str(e))
 
     def load_playlist(self):
-        opts = file_dialog_options(False)
+        # Refuse before the dialog opens, so a picked file is never silently dropped
+        if self._playlist_loading:
+            self._show_status("Playlist load already in progress")
+            return
+        opts = FILE_DIALOG_OPTIONS
         file_name, _ = QFileDialog.getOpenFileName(self, "Load Playlist", "", "JSON Files (*.*)", options=opts)
-        if file_name:
-            try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                if isinstance(data, list) and all('path' in d and 'type' in d for d in data):
-                    self.playlist = data
+        if not file_name:
+            return
+        # Read + parse on the thread pool; _on_playlist_loaded() fills the UI
+        self._playlist_loading = True
+        self.load_progress.show()
+        self._show_status(f"Loading playlist: {basename(file_name)}")
+        QtCore.QThreadPool.globalInstance().start(_PlaylistLoadJob(file_name, self._playlist_signals))
+
+    def _on_playlist_load_failed(self, file_name: str, error: str):
+        self._playlist_loading = False
+        self.load_progress.hide()
+        QMessageBox.critical(self, "Error Loading Playlist", error)
+
+    def _on_playlist_loaded(self, file_name: str, data):
+        self._playlist_loading = False
+        self.load_progress.hide()
+        try:
+            if isinstance(data, list) and all('path' in d and 'type' in d for d in data):
+                self.playlist = data
+                self._path_index = {it.get("path") for it in self.playlist}
+                self._stream_urls = {it.get("path") for it in self.playlist if it.get("type") == "stream"}
+                self._url_cache = {}
+                stale = []
+                labels = []
+                for item in self.playlist:
+                    # Metadata cached in the playlist is used as-is; older or
+                    # missing entries are refreshed in the background.
+                    if item.get("type") != "stream" and item.get("meta_version") != META_VERSION:
+                        stale.append((item.get("path", ""), item.get("type", "audio")))
+                    labels.append(item.get("display") or basename(item.get('path','')))
+                with suspended(self.playlist_widget):
                     self.playlist_widget.clear()
-                    for item in self.playlist:
-                        # Backfill metadata for older playlists
-                        if "display" not in item or "artist" not in item or "title" not in item:
-                            meta = self._build_media_meta(item.get("path",""), item.get("type","audio"))
-                            item.update(meta)
-                        self.playlist_widget.addItem(item.get("display") or basename(item.get('path','')))
-                    self._update_controls_enabled()
-                    QMessageBox.information(self, "Playlist Loaded", f"Playlist loaded from {file_name}")
-                else:
-                    QMessageBox.warning(self, "Invalid File", "The selected JSON does not contain a valid playlist.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error Loading Playlist", str(e))
+                    self.playlist_widget.addItems(labels)
+                self._update_controls_enabled()
+                self._refresh_meta_async(stale)
+                QMessageBox.information(self, "Playlist Loaded", f"Playlist loaded from {file_name}")
+            else:
+                QMessageBox.warning(self, "Invalid File", "The selected JSON does not contain a valid playlist.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error Loading Playlist", str(e))
 
     # ---------------- Music tab actions ----------------
     def add_songs(self):
-        opts = file_dialog_options(False)
+        opts = FILE_DIALOG_OPTIONS
         files, _ = QFileDialog.getOpenFileNames(
             self,
             "Add Media Files",
@@ -685,24 +953,28 @@ class MainWindow(QMainWindow):
         )
         if not files:
             return
+        items = []
+        added = set()
+        pending = []
+        ext_to_type = self.EXT_TO_TYPE
         for file_path in files:
-            if any(it["path"] == file_path for it in self.playlist):
+            if file_path in self._path_index or file_path in added:
                 continue
-            ext = splitext(file_path)[1].lower()
-            if ext in self.SUPPORTED_VIDEO_EXTENSIONS:
-                mtype = "video"
-            elif ext in self.SUPPORTED_AUDIO_EXTENSIONS:
-                mtype = "audio"
-            else:
+            mtype = ext_to_type.get(file_path.rpartition(".")[2].lower())
+            if mtype is None:
                 QMessageBox.warning(self, "Unsupported Format", f"Skipping:\n{basename(file_path)}")
                 continue
             if not os.path.exists(file_path):
                 QMessageBox.warning(self, "File Not Found", f"The file does not exist:\n{basename(file_path)}")
                 continue
-            meta = self._build_media_meta(file_path, mtype)
-            self.playlist.append({"path": file_path, "type": mtype, **meta})
-            self.playlist_widget.addItem(meta.get("display") or basename(file_path))
-        self._update_controls_enabled()
+            # Filename placeholder now; tags are read on the thread pool
+            meta = self._build_media_meta(file_path, mtype, read_tags=False)
+            items.append({"path": file_path, "type": mtype, **meta})
+            added.add(file_path)
+            if "meta_version" not in meta:
+                pending.append((file_path, mtype))
+        self._append_playlist_items(items)
+        self._refresh_meta_async(pending)
 
     def remove_songs(self):
         selected = self.playlist_widget.selectedItems()
@@ -715,6 +987,10 @@ class MainWindow(QMainWindow):
                 self.playlist_widget.takeItem(idx)
                 if idx == self.current_song_index:
                     self.stop_song()
+        # Rebuild rather than discard: loaded playlists may contain duplicates
+        self._path_index = {it.get("path") for it in self.playlist}
+        self._stream_urls = {it.get("path") for it in self.playlist if it.get("type") == "stream"}
+        self._url_cache = {p: u for p, u in self._url_cache.items() if p in self._path_index}
         if self.current_song_index >= len(self.playlist):
             self.current_song_index = len(self.playlist) - 1
         self._update_controls_enabled()
@@ -750,17 +1026,10 @@ class MainWindow(QMainWindow):
         paused_backend = False
         stopped_backend = False
         try:
-            if USING_QT6:
-                from PyQt6.QtMultimedia import QMediaPlayer as _QMP
-                st = self.player.playbackState()
-                playing_backend = (st == _QMP.PlaybackState.PlayingState)
-                paused_backend = (st == _QMP.PlaybackState.PausedState)
-                stopped_backend = (st == _QMP.PlaybackState.StoppedState)
-            else:
-                st = self.player.state()
-                playing_backend = (st == QMediaPlayer.State.PlayingState)
-                paused_backend = (st == QMediaPlayer.State.PausedState)
-                stopped_backend = (st == QMediaPlayer.State.StoppedState)
+            st = self.player.playbackState() if USING_QT6 else self.player.state()
+            playing_backend = (st == PLAYING_STATE)
+            paused_backend = (st == PAUSED_STATE)
+            stopped_backend = (st == STOPPED_STATE)
         except Exception:
             # If we can't query state, assume "not playing" and try to play.
             playing_backend = False
@@ -787,7 +1056,7 @@ class MainWindow(QMainWindow):
                 self.player.pause()
             except Exception:
                 pass
-            QtCore.QTimer.singleShot(140, lambda: self._mpris_notify(playback=True))
+            self._mpris_notify(playback=True)
             return
 
         # If currently paused -> play
@@ -797,7 +1066,7 @@ class MainWindow(QMainWindow):
                 self.player.play()
             except Exception:
                 pass
-            QtCore.QTimer.singleShot(140, lambda: self._mpris_notify(playback=True))
+            self._mpris_notify(playback=True)
             return
 
         # If stopped/no media -> load current track (or first track)
@@ -812,16 +1081,23 @@ class MainWindow(QMainWindow):
         # Start playback from stopped state
         self._mpris_force_status_immediate("Playing")
         self.play_song()
-        QtCore.QTimer.singleShot(200, lambda: self._mpris_notify(playback=True))
 
     def play_song(self):
 
         if not (0 <= self.current_song_index < len(self.playlist)):
             return
         media_info = self.playlist[self.current_song_index]
-        # Ensure we have display metadata (older playlist entries)
+        # A seek queued for the previous track must not land on this one
+        self._seek_timer.stop()
+        self._seek_pending = None
+        # Ensure we have display metadata (older playlist entries). Use the
+        # filename now; tags are read on the thread pool (see _on_meta_ready).
         if "display" not in media_info or "title" not in media_info or "artist" not in media_info:
-            media_info.update(self._build_media_meta(media_info.get("path",""), media_info.get("type","audio")))
+            path, mt = media_info.get("path", ""), media_info.get("type", "audio")
+            meta = self._build_media_meta(path, mt, read_tags=False)
+            media_info.update(meta)
+            if "meta_version" not in meta:
+                self._refresh_meta_async([(path, mt)])
         file_path = media_info["path"]
         mtype = media_info["type"]
         self.current_media_type = mtype
@@ -834,18 +1110,15 @@ class MainWindow(QMainWindow):
             else:
                 self.player.setMedia(QMediaContent(QUrl(file_path)))
 
-            # reset end-guard for a new source
-            self._end_guard = False
             self.player.play()
 
             # Notify MPRIS clients
             self._mpris_force_status_immediate("Playing")
-            self._mpris_notify(metadata=True)
-            QtCore.QTimer.singleShot(140, lambda: self._mpris_notify(playback=True))
+            self._mpris_notify(metadata=True, playback=True)
 
             self.playback_slider.setEnabled(True)
             self.stop_button.setEnabled(True)
-            self.status_bar.showMessage(f"Streaming: {media_info.get('display') or file_path}")
+            self._show_status(f"Streaming: {media_info.get('display') or file_path}")
             self._lyrics_call("clear")
             return
 
@@ -858,13 +1131,13 @@ class MainWindow(QMainWindow):
         else:
             self.video_widget.hide()
 
+        url = self._url_cache.get(file_path)
+        if url is None:
+            url = self._url_cache[file_path] = QUrl.fromLocalFile(file_path)
         if USING_QT6:
-            self.player.setSource(QUrl.fromLocalFile(file_path))
+            self.player.setSource(url)
         else:
-            self.player.setMedia(QMediaContent(QUrl.fromLocalFile(file_path)))
-
-        # reset end-guard for a new track
-        self._end_guard = False
+            self.player.setMedia(QMediaContent(url))
 
         self.player.play()
 
@@ -874,37 +1147,35 @@ class MainWindow(QMainWindow):
         self.playback_slider.setEnabled(True)
         self.stop_button.setEnabled(True)
         disp = media_info.get("display") or basename(file_path)
-        self.status_bar.showMessage(f"Playing: {disp}")
+        self._show_status(f"Playing: {disp}")
 
         # Inform lyrics module of current media
         self._lyrics_call("set_media", file_path)
     def stop_song(self):
         self.player.stop()
+        self._pos_flush_timer.stop()
+        self._seek_timer.stop()
+        self._seek_pending = None
         self.playback_slider.setValue(0)
         self.playback_slider.setEnabled(False)
         self.stop_button.setEnabled(False)
         self._set_play_button_text("Play")
         self.current_time_label.setText("00:00:00")
-        self.status_bar.showMessage("Playback stopped.")
+        self._show_status("Playback stopped.")
         self._mpris_notify(metadata=True, playback=True)
         self.video_widget.hide()
         self._lyrics_call("clear")
-        # prevent watchdog from firing after manual stop
-        self._end_guard = True
 
     def next_song(self):
         if not self.playlist:
             return
         if self.shuffle_mode and len(self.playlist) > 1:
-            choices = list(range(len(self.playlist)))
-            if 0 <= self.current_song_index < len(self.playlist):
-                choices.pop(self.current_song_index)
-            self.current_song_index = random.choice(choices)
+            self.current_song_index = self._pick_shuffle_index()
         else:
             if (self.current_song_index + 1) < len(self.playlist):
                 self.current_song_index += 1
             else:
-                self.status_bar.showMessage("End of playlist.")
+                self._show_status("End of playlist.")
                 self.stop_song()
                 return
         self.playlist_widget.setCurrentRow(self.current_song_index)
@@ -914,28 +1185,35 @@ class MainWindow(QMainWindow):
         if not self.playlist:
             return
         if self.shuffle_mode and len(self.playlist) > 1:
-            choices = list(range(len(self.playlist)))
-            if 0 <= self.current_song_index < len(self.playlist):
-                choices.pop(self.current_song_index)
-            self.current_song_index = random.choice(choices)
+            self.current_song_index = self._pick_shuffle_index()
         else:
             if (self.current_song_index - 1) >= 0:
                 self.current_song_index -= 1
             else:
-                self.status_bar.showMessage("Start of playlist.")
+                self._show_status("Start of playlist.")
                 self.current_song_index = 0
         self.playlist_widget.setCurrentRow(self.current_song_index)
         self.play_song()
 
+    def _pick_shuffle_index(self) -> int:
+        """Random playlist index other than the current one (needs >= 2 items)."""
+        n = len(self.playlist)
+        cur = self.current_song_index
+        if not (0 <= cur < n):
+            return random.randrange(n)
+        # Draw from n-1 slots and shift past the current index
+        idx = random.randrange(n - 1)
+        return idx + 1 if idx >= cur else idx
+
     def toggle_shuffle(self):
         self.shuffle_mode = not self.shuffle_mode
         self.shuffle_button.setText("Shuffle ON" if self.shuffle_mode else "Shuffle OFF")
-        self.status_bar.showMessage(f"Shuffle Mode: {'ON' if self.shuffle_mode else 'OFF'}")
+        self._set_status(f"Shuffle Mode: {'ON' if self.shuffle_mode else 'OFF'}")
 
     def toggle_repeat(self):
         self.repeat_mode = not self.repeat_mode
         self.repeat_button.setText("Repeat ON" if self.repeat_mode else "Repeat OFF")
-        self.status_bar.showMessage(f"Repeat Mode: {'ON (Current Track)' if self.repeat_mode else 'OFF'}")
+        self._set_status(f"Repeat Mode: {'ON (Current Track)' if self.repeat_mode else 'OFF'}")
 
     # ---------------- Volume / Mute ----------------
     def change_volume(self, value: int):
@@ -943,74 +1221,106 @@ class MainWindow(QMainWindow):
             self.audio_out.setVolume(max(0.0, min(1.0, value / 100.0)))
         else:
             self.player.setVolume(value)
-        self.status_bar.showMessage(f"Volume: {value}%")
+        self._set_status(f"Volume: {value}%")
 
     def toggle_mute(self):
         if USING_QT6:
             self.audio_out.setMuted(self.mute_button.isChecked())
         else:
             self.player.setMuted(self.mute_button.isChecked())
-        self.status_bar.showMessage("Muted" if self.mute_button.isChecked() else f"Volume: {self.volume_slider.value()}%")
+        self._set_status("Muted" if self.mute_button.isChecked() else f"Volume: {self.volume_slider.value()}%")
+
+    def _set_status(self, msg: str):
+        """Queue a status bar message; bursts are coalesced to the latest one."""
+        self._status_pending = msg
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        msg, self._status_pending = self._status_pending, None
+        if msg:
+            self.status_bar.showMessage(msg)
+
+    def _show_status(self, msg: str):
+        """Show a message now, dropping any queued one so it can't overwrite it later."""
+        self._status_timer.stop()
+        self._status_pending = None
+        self.status_bar.showMessage(msg)
 
     # ---------------- Slider / time ----------------
     def update_slider(self, position_ms: int):
+        """positionChanged slot: record the position; UI work is coalesced."""
+        pos = int(position_ms)
         # Track real movement (Qt playbackState() can lie on some backends)
-        try:
-            if position_ms != self._last_pos_ms:
-                self._last_pos_ms = int(position_ms)
-                self._last_pos_moved_at = time.monotonic()
-        except Exception:
-            pass        # Throttle slider/UI updates to reduce churn (especially on some backends
-        # where positionChanged fires very frequently).
-        sec = int(position_ms) // 1000
-        should_update_slider = (abs(int(position_ms) - int(getattr(self, "_last_slider_update_ms", -999999))) >= 200) or (sec != int(getattr(self, "_last_ui_second", -1)))
+        if pos != self._last_pos_ms:
+            self._last_pos_ms = pos
+            self._last_pos_moved_at = time.monotonic()
 
-        if should_update_slider:
-            self._last_slider_update_ms = int(position_ms)
+        self._pending_pos_ms = pos
+        if not self._pos_flush_timer.isActive():
+            self._pos_flush_timer.start(250)
+
+    def _flush_position(self):
+        """Push the latest position to the slider, clock and lyrics."""
+        pos = self._pending_pos_ms
+        sec = pos // 1000
+
+        # Don't pull the handle back while the user is dragging it
+        if not self.playback_slider.isSliderDown():
             self.playback_slider.blockSignals(True)
-            self.playback_slider.setValue(position_ms)
+            self.playback_slider.setValue(pos)
             self.playback_slider.blockSignals(False)
 
-        if sec != int(getattr(self, "_last_ui_second", -1)):
+        if sec != self._last_ui_second:
             self._last_ui_second = sec
-            self.current_time_label.setText(self._millis_to_clock(position_ms))
+            self.current_time_label.setText(self._millis_to_clock(pos))
             # Lyrics updates are typically second-granularity; throttle here too.
-            self._lyrics_call("update_position", int(position_ms))
-
-        # Watchdog: if we're within 1s of the end and not advanced yet, advance once.
-        if self._duration_ms > 0:
-            if position_ms >= max(0, self._duration_ms - 1000) and not self._end_guard:
-                self._end_guard = True
-                QtCore.QTimer.singleShot(50, self._advance_after_end)
-
+            # Skipped while the panel is hidden (show_lyrics resyncs).
+            if self._lyrics_visible:
+                self._lyrics_call("update_position", pos)
 
     def set_duration(self, duration_ms: int):
+        # New media: bound the clock cache to roughly one track's worth
+        self._clock_cache.clear()
         self._duration_ms = max(0, int(duration_ms))
         self.playback_slider.setRange(0, self._duration_ms)
         self.total_time_label.setText(self._millis_to_clock(self._duration_ms))
-        self._end_guard = False
 
     def seek_position(self, position_ms: int):
-        self.player.setPosition(position_ms)
+        """sliderMoved slot: update the clock now; the backend seek is coalesced."""
+        self._seek_pending = int(position_ms)
         self.current_time_label.setText(self._millis_to_clock(position_ms))
-        self.status_bar.showMessage(f"Seeked to: {self._millis_to_clock(position_ms)}")
-        self._lyrics_call("update_position", int(position_ms))
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _do_seek(self):
+        pos, self._seek_pending = self._seek_pending, None
+        if pos is None:
+            return
+        self.player.setPosition(pos)
+        self._set_status(f"Seeked to: {self._millis_to_clock(pos)}")
+        if self._lyrics_visible:
+            self._lyrics_call("update_position", pos)
 
     # ---------------- Media status / errors ----------------
     def handle_media_status(self, status):
-        name = getattr(status, 'name', str(status))
-        if 'EndOfMedia' in name:
+        if status == END_OF_MEDIA:
             self._advance_after_end()
-        if 'LoadedMedia' in name or 'BufferedMedia' in name:
-            self._end_guard = False
 
     def _advance_after_end(self):
-        if self.repeat_mode:
-            self.player.setPosition(0)
-            self.player.play()
-            self._end_guard = False
-        else:
-            self.next_song()
+        # Re-entrancy guard: starting the next source can emit status changes
+        # synchronously on some backends.
+        if self._advancing:
+            return
+        self._advancing = True
+        try:
+            if self.repeat_mode:
+                self.player.setPosition(0)
+                self.player.play()
+            else:
+                self.next_song()
+        finally:
+            self._advancing = False
 
     def handle_error(self, *args):
         err = ""
@@ -1024,7 +1334,8 @@ class MainWindow(QMainWindow):
 
     # ---------------- Key handling ----------------
     def keyPressEvent(self, event):
-        if event.key() == key('Key_F11'):
+        k = event.key()
+        if k == KEY_F11:
             if self.isFullScreen():
                 self.showNormal()
                 self._show_normal_ui()
@@ -1032,7 +1343,7 @@ class MainWindow(QMainWindow):
                 self.showFullScreen()
                 self._hide_ui_for_fullscreen()
 
-        elif event.key() == key('Key_Escape') and self.isFullScreen():
+        elif k == KEY_ESCAPE and self.isFullScreen():
             self.showNormal()
             self._show_normal_ui()
 
@@ -1040,73 +1351,44 @@ class MainWindow(QMainWindow):
         # Do NOT handle Key_P here. Alt+P is already handled by the QAction shortcut.
         # Handling it here causes Alt+P to toggle twice (QAction + keyPressEvent).
 
-        elif event.key() == key('Key_L') and (event.modifiers() & (Qt.KeyboardModifier.ControlModifier if USING_QT6 else Qt.ControlModifier)):
+        elif k == KEY_L and (event.modifiers() & CTRL_MOD):
             self.toggle_lyrics()
 
         else:
             super().keyPressEvent(event)
             
     def _hide_ui_for_fullscreen(self):
-        self.playlist_widget.hide()
-        self.play_button.hide()
-        self.stop_button.hide()
-        self.mute_button.hide()
-        self.add_button.hide()
-        self.prev_button.hide()
-        self.next_button.hide()
-        self.remove_button.hide()
-        self.shuffle_button.hide()
-        self.repeat_button.hide()
-        self.tab_widget.hide()
-        self.lyrics_button.hide()
-        self.playback_slider.hide()
-        self.theme_combo.hide()
-        self.volume_slider.hide()
-        self.total_time_label.hide()
-        self.current_time_label.hide()
-        self.menuBar().hide()
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._fs_widgets:
+                w.hide()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _show_normal_ui(self):
-        self.playlist_widget.show()
-        self.play_button.show()
-        self.stop_button.show()
-        self.mute_button.show()
-        self.add_button.show()
-        self.prev_button.show()
-        self.next_button.show()
-        self.remove_button.show()
-        self.shuffle_button.show()
-        self.repeat_button.show()
-        self.tab_widget.show()
-        self.lyrics_button.show()
-        self.playback_slider.show()
-        self.theme_combo.show()
-        self.volume_slider.show()
-        self.total_time_label.show()
-        self.current_time_label.show()
-        self.menuBar().show()
-        
+        self.setUpdatesEnabled(False)
+        try:
+            for w in self._fs_widgets:
+                w.show()
+        finally:
+            self.setUpdatesEnabled(True)
+
     # ---------------- Helpers ----------------
     def _update_controls_enabled(self):
         enabled = bool(self.playlist)
-        for w in (self.play_button, self.remove_button, self.prev_button,
-                  self.next_button, self.shuffle_button, self.repeat_button):
+        if enabled == self._controls_enabled:
+            return
+        self._controls_enabled = enabled
+        for w in self._control_buttons:
             w.setEnabled(enabled)
 
     def player_is_playing(self) -> bool:
-        """Helper for MPRIS: return True if Qt player is currently playing."""
-        try:
-            if USING_QT6:
-                from PyQt6.QtMultimedia import QMediaPlayer as QMP
-                return self.player.playbackState() == QMP.PlaybackState.PlayingState
-            else:
-                st = self.player.state()
-                try:
-                    return st == QMediaPlayer.State.PlayingState
-                except Exception:
-                    return st == getattr(QMediaPlayer, 'PlayingState', st)
-        except Exception:
-            return False
+        """Helper for MPRIS: return True if Qt player is currently playing.
+
+        Reads the flag kept by the state-change adapters instead of querying
+        the multimedia backend.
+        """
+        return bool(self._last_playing)
     def _is_effectively_playing(self) -> bool:
         """
         More reliable than playbackState() on some systems.
@@ -1115,40 +1397,26 @@ class MainWindow(QMainWindow):
         Important: if the backend explicitly reports Paused, we treat it as paused
         (even if the position moved a moment ago).
         """
-        try:
-            # Trust explicit "Playing"
-            if self.player_is_playing():
-                return True
-
-            # Trust explicit "Paused" if available
-            try:
-                if USING_QT6:
-                    from PyQt6.QtMultimedia import QMediaPlayer as QMP
-                    if self.player.playbackState() == QMP.PlaybackState.PausedState:
-                        return False
-                else:
-                    st = self.player.state()
-                    try:
-                        if st == QMediaPlayer.State.PausedState:
-                            return False
-                    except Exception:
-                        if st == getattr(QMediaPlayer, "PausedState", st):
-                            return False
-            except Exception:
-                pass
-
-            # If we saw position move in the last ~0.7s, it is effectively playing.
-            moved_recently = (time.monotonic() - float(getattr(self, "_last_pos_moved_at", 0.0))) < 0.7
-            return bool(moved_recently and self.player.position() > 0)
-        except Exception:
+        # Trust explicit "Playing" / "Paused" (as last reported by Qt)
+        if self._last_playing:
+            return True
+        if self._last_paused:
             return False
 
+        # If we saw position move in the last ~0.7s, it is effectively playing.
+        moved_recently = (time.monotonic() - self._last_pos_moved_at) < 0.7
+        return bool(moved_recently and self._last_pos_ms > 0)
 
-    def _build_media_meta(self, file_path: str, mtype: str = 'audio') -> dict:
+
+    def _build_media_meta(self, file_path: str, mtype: str = 'audio', read_tags: bool = True) -> dict:
         """Return parsed media metadata for display/MPRIS.
 
         Keeps dependencies optional: if mutagen is available, use tags;
         otherwise fall back to filename heuristics.
+
+        read_tags=False gives a quick filename-only placeholder. For audio it
+        carries no meta_version, so the entry still counts as stale until the
+        tags have been read in the background.
         """
         artist = ""
         title = ""
@@ -1159,17 +1427,17 @@ class MainWindow(QMainWindow):
             base = basename(file_path or "")
             stem = splitext(base)[0]
             title = stem
-            for sep in (" — ", " - ", " – ", "_-"):
-                if sep in stem:
-                    a, t = stem.split(sep, 1)
-                    artist = a.strip()
-                    title = t.strip()
+            for rx in _ARTIST_TITLE_RES:
+                m = rx.match(stem)
+                if m:
+                    artist = m.group(1).strip()
+                    title = m.group(2).strip()
                     break
         except Exception:
             title = basename(file_path or "")
 
         # Optional tag read (audio)
-        if mtype == 'audio':
+        if mtype == 'audio' and read_tags:
             try:
                 from mutagen import File as MutagenFile  # type: ignore
                 mf = MutagenFile(file_path, easy=True)
@@ -1185,46 +1453,68 @@ class MainWindow(QMainWindow):
 
         title = title or "Unknown"
         display = f"{artist} — {title}" if artist else title
-        return {"artist": artist, "title": title, "display": display}
+        meta = {"artist": artist, "title": title, "display": display}
+        if read_tags or mtype != 'audio':
+            meta["meta_version"] = META_VERSION
+        return meta
+
+    def _refresh_meta_async(self, entries):
+        """Re-read metadata for (path, mtype) entries on the global thread pool."""
+        if not entries:
+            return
+        job = _MetaJob(self._build_media_meta, self._meta_signals, list(entries))
+        QtCore.QThreadPool.globalInstance().start(job)
+
+    def _on_meta_ready(self, results):
+        """Apply background metadata to playlist entries and their rows."""
+        rows = {it.get("path"): i for i, it in enumerate(self.playlist)}
+        for path, meta in results:
+            idx = rows.get(path)
+            if idx is None:
+                # Removed from the playlist meanwhile
+                continue
+            entry = self.playlist[idx]
+            changed = entry.get("display") != meta.get("display")
+            entry.update(meta)
+            if not changed:
+                continue
+            row = self.playlist_widget.item(idx)
+            if row is not None:
+                row.setText(meta.get("display") or basename(path))
+            if idx == self.current_song_index:
+                self._show_status(f"Playing: {meta.get('display') or basename(path)}")
+                self._mpris_notify(metadata=True)
 
-    def eventFilter(self, obj, event):
-        """Global key handler (when app focused) for Space / media keys.
+    def _mpris_notify(self, metadata: bool = False, playback: bool = False):
+        """Queue MPRIS playback and/or metadata notifications.
 
-        Alt+P is handled by QAction shortcut; this covers Space/media keys and
-        avoids toggling while typing in text fields.
+        Requests are OR-ed into a pending mask and sent once by _mpris_flush(),
+        so bursts (play_song + state change + metadata) cost one DBus round.
         """
-        try:
-            et = event.type()
-            if USING_QT6:
-                is_keypress = (et == QtCore.QEvent.Type.KeyPress)
-            else:
-                is_keypress = (et == QtCore.QEvent.KeyPress)
-
-            if is_keypress:
-                fw = QtWidgets.QApplication.focusWidget()
-                if isinstance(fw, QLineEdit):
-                    return False
-
-                k = event.key()
-                keys = []
-                for nm in ('Key_Space', 'Key_MediaTogglePlayPause', 'Key_MediaPlay', 'Key_MediaPause'):
-                    try:
-                        keys.append(key(nm))
-                    except Exception:
-                        pass
-
-                if k in keys:
-                    self._toggle_play_pause_shortcut()
-                    return True
-        except Exception:
-            pass
-
-        return super().eventFilter(obj, event)
-
-    def _mpris_notify(self, metadata: bool = False, playback: bool = False):
-        """Notify MPRIS clients about playback and/or metadata changes."""
+        if not getattr(self, 'mpris', None):
+            return
+        self._mpris_pending |= (_MPRIS_PLAYBACK if playback else 0) | (_MPRIS_METADATA if metadata else 0)
+        if self._mpris_pending and not self._mpris_kick.isActive():
+            self._mpris_kick.start()
+
+    def _mpris_flush(self):
+        """Send the pending MPRIS notifications."""
+        pending, self._mpris_pending = self._mpris_pending, 0
+        playback = bool(pending & _MPRIS_PLAYBACK)
+        metadata = bool(pending & _MPRIS_METADATA)
         m = getattr(self, 'mpris', None)
-        if not m:
+        if not m or not pending:
+            return
+        # Skip notifications whose inputs are unchanged since the last send
+        if playback:
+            key = self._applied_state
+            playback = key != self._mpris_sent_playback
+            self._mpris_sent_playback = key
+        if metadata:
+            key = self._mpris_metadata_key()
+            metadata = key != self._mpris_sent_metadata
+            self._mpris_sent_metadata = key
+        if not (playback or metadata):
             return
         try:
             if playback:
@@ -1235,23 +1525,35 @@ class MainWindow(QMainWindow):
                 fn = getattr(m, 'notify_metadata', None)
                 if callable(fn):
                     fn()
-            # Always pump GLib/DBus so changes flush quickly
+            # Fallback path only: without Qt's GLib dispatcher, pump DBus so the
+            # change goes out now (poll() is a no-op when Qt drives GLib)
             fn = getattr(m, 'poll', None)
             if callable(fn):
                 fn()
         except Exception:
             pass
 
+    def _mpris_metadata_key(self):
+        """Everything the MPRIS Metadata property is built from."""
+        idx = self.current_song_index
+        item = self.playlist[idx] if 0 <= idx < len(self.playlist) else {}
+        return (idx, item.get("path"), item.get("title"), item.get("artist"),
+                item.get("display"), self._duration_ms)
+
     def _set_play_button_text(self, txt: str):
         self.play_button.setText(txt)
 
     def _millis_to_clock(self, millis: int) -> str:
-        """Format milliseconds as HH:MM:SS for the UI."""
+        """Format milliseconds as HH:MM:SS for the UI (memoized per second)."""
         s = max(0, int(millis) // 1000)
-        h = s // 3600
-        m = (s % 3600) // 60
-        s = s % 60
-        return f"{h:02}:{m:02}:{s:02}"
+        c = self._clock_cache.get(s)
+        if c is None:
+            h, rem = divmod(s, 3600)
+            m, sec = divmod(rem, 60)
+            c = f"{h:02}:{m:02}:{sec:02}"
+            if len(self._clock_cache) < 8192:
+                self._clock_cache[s] = c
+        return c
 
     # Backward-compatible helper (older code paths)
     def _millis_to_time(self, millis: int) -> str:
@@ -1277,6 +1579,8 @@ class MainWindow(QMainWindow):
         try:
             self.lyrics.show_panel()
             self._lyrics_visible = True
+            # Position updates are skipped while hidden; catch up now
+            self._lyrics_call("update_position", int(self.player.position()))
             if hasattr(self, "lyrics_button"):
                 self.lyrics_button.setChecked(True)
                 self.lyrics_button.setText("Hide Lyrics")
@@ -1317,63 +1621,35 @@ class MainWindow(QMainWindow):
         if not name or not url:
             QMessageBox.warning(self, "Invalid Input", "Stream name and URL cannot be empty.")
             return
-        if any(it.get("type") == "stream" and it.get("path") == url for it in self.playlist):
+        if url in self._stream_urls:
             QMessageBox.information(self, "Already Added", "This stream URL is already in the playlist.")
             return
 
-        item = {"path": url, "type": "stream", "artist": "", "title": name, "display": name}
-        self.playlist.append(item)
-        self.playlist_widget.addItem(name)
+        self._append_playlist_items(
+            [{"path": url, "type": "stream", "artist": "", "title": name, "display": name}]
+        )
         self.custom_station_name.clear()
         self.custom_station_url.clear()
-        self._update_controls_enabled()
 
 
 
     # ---------------- State change adapters ----------------
     def _on_playback_state_changed(self, state):
-        """Qt6: playbackStateChanged adapter (and safe no-op on Qt5)."""
-        playing = False
-        try:
-            if USING_QT6:
-                from PyQt6.QtMultimedia import QMediaPlayer as _QMP  # type: ignore
-                playing = (state == _QMP.PlaybackState.PlayingState)
-            else:
-                playing = bool(self.player_is_playing())
-        except Exception:
-            playing = bool(getattr(self, "_last_playing", False))
-
-        self._last_playing = playing
-        self._mpris_last_playing = playing
+        """Qt6: playbackStateChanged adapter."""
+        self._apply_playback_state(state)
 
-        self._set_play_button_text("Pause" if playing else "Play")
-        self._lyrics_call("set_playing", playing)
-        self._update_controls_enabled()
-
-        # Clear any temporary forced OSD state
-        try:
-            m = getattr(self, "mpris", None)
-            fn = getattr(m, "clear_forced_playback_status", None) if m else None
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
+    def _on_state_changed(self, state):
+        """Qt5: stateChanged adapter."""
+        self._apply_playback_state(state)
 
-        self._mpris_notify(playback=True)
+    def _apply_playback_state(self, state):
+        """Shared tail of both adapters; repeated emissions of the same state are ignored."""
+        if state == self._applied_state:
+            return
+        self._applied_state = state
 
-    def _on_state_changed(self, state):
-        """Qt5: stateChanged adapter (and safe fallback on Qt6)."""
-        playing = False
-        try:
-            if USING_QT6:
-                playing = bool(self.player_is_playing())
-            else:
-                try:
-                    playing = (state == QMediaPlayer.State.PlayingState)
-                except Exception:
-                    playing = (state == getattr(QMediaPlayer, "PlayingState", state))
-        except Exception:
-            playing = bool(getattr(self, "_last_playing", False))
+        playing = (state == PLAYING_STATE)
+        self._last_paused = (state == PAUSED_STATE)
 
         self._last_playing = playing
         self._mpris_last_playing = playing
@@ -1395,14 +1671,6 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Stop timers, playback, and helper modules cleanly."""
-        # Stop MPRIS polling
-        try:
-            t = getattr(self, "_mpris_timer", None)
-            if t:
-                t.stop()
-        except Exception:
-            pass
-
         # Stop playback
         try:
             self.player.stop()
@@ -1418,7 +1686,7 @@ class MainWindow(QMainWindow):
         except Exception:
             pass
 
-        # Let MPRIS quit hook be a no-op
+        # Stop MPRIS fallback polling (no-op under the GLib dispatcher)
         try:
             m = getattr(self, "mpris", None)
             fn = getattr(m, "stop", None) if m else None
@@ -2,10 +2,14 @@
 # generic_player_lyrics.py — minimal show/hide lyrics, robust metadata detection
 # GPL v2 — JJ Posti (techtimejourney.net) 2025. 
 
-import os, re, sys
+import os, re, sys, time, hashlib, mmap, queue, sqlite3, threading
 sys.dont_write_bytecode = True
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from html import escape as _std_escape
+from pathlib import Path
+from urllib.parse import quote
+from typing import Callable, Optional, Tuple
 
 # -------- Optional deps --------
 try:
@@ -14,11 +18,20 @@ try:
 except Exception:
     _HAVE_REQUESTS = False
 
+# Tag readers in order of preference, each with the File(path, easy=True) API
+_TAG_READERS = []
+try:
+    # Rust port; much faster cold reads
+    from mutagen_rs import File as _RsFile
+    _TAG_READERS.append(_RsFile)
+except Exception:
+    pass
 try:
     from mutagen import File as MutagenFile
-    _HAVE_MUTAGEN = True
+    _TAG_READERS.append(MutagenFile)
 except Exception:
-    _HAVE_MUTAGEN = False
+    pass
+_HAVE_MUTAGEN = bool(_TAG_READERS)
 
 # -------- Qt shims --------
 USING_QT6 = False
@@ -39,6 +52,7 @@ else:
 LYRICS_TIMEOUT = 10
 LYRICS_USER_AGENT = "Generic_Player-Lyrics/1.2"
 DEFAULT_DOCK_WIDTH = 560  # widen the lyrics pane
+LYRICS_MISS_TTL = 3600  # seconds before a "not found" is asked online again
 
 DARK_STYLESHEET = """
 QDockWidget::title { padding: 6px 8px; background: #1a262d; color: #e5e9ec; }
@@ -54,15 +68,23 @@ QTextBrowser {
 """
 
 # -------- Helpers --------
+_EXTS = frozenset({".mp3", ".flac", ".ogg", ".wav", ".m4a", ".aac", ".wma",
+                   ".mp4", ".mkv", ".avi", ".mov", ".wmv"})
+_BRACKET_RE = re.compile(r"\s*\[[^\]]+\]$")          # [Live], [Remastered]
+_PAREN_RE = re.compile(r"\s*\(.*?\)\s*$")            # (Radio Edit)
+# "Artist - Title" with an optional leading "01 - " track number
+_FNAME_RE = re.compile(r"^\s*(?:(?P<num>\d{1,3})\s*[-–—]\s*)?(?P<a>.+?)\s*[-–—]\s*(?P<t>.+?)\s*$")
+_LEADING_TRACKNUM_RE = re.compile(r"^(?:[A-Za-z]?\d{1,3}[\s\.\-_]+)")
+_CTRL_RE = re.compile(r"[\x00-\x1f\x7f]")
+_ARTIST_KEYS = frozenset({"artist", "ARTIST", "TPE1"})
+_TITLE_KEYS = frozenset({"title", "TITLE", "TIT2"})
+
 def _strip_ext(name: str) -> str:
-    return re.sub(r"\.(mp3|flac|ogg|wav|m4a|aac|wma|mp4|mkv|avi|mov|wmv)$", "", name, flags=re.I)
+    base, ext = os.path.splitext(name)
+    return base if ext.lower() in _EXTS else name
 
 def _html_escape(s: str) -> str:
-    return (s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;"))
+    return _std_escape(s, quote=True)
 
 def _ensure_str(val) -> str:
     if val is None:
@@ -78,34 +100,63 @@ def _ensure_str(val) -> str:
     return str(val)
 
 def _clean_piece(s: str) -> str:
-    s = re.sub(r"\s*\[[^\]]+\]$", "", s)     # [Live], [Remastered]
-    s = re.sub(r"\s*\(.*?\)\s*$", "", s)     # (Radio Edit)
+    s = _BRACKET_RE.sub("", s)
+    s = _PAREN_RE.sub("", s)
     s = s.replace("_", " ")
     return s.strip(" -_.")
 
+# (path, mtime_ns, size) -> (artist, title); a replaced file changes the key
+_TAG_CACHE: "OrderedDict[tuple, Tuple[Optional[str], Optional[str]]]" = OrderedDict()
+_TAG_CACHE_MAX = 256
+
 def parse_artist_title_from_tags(path: str) -> Tuple[Optional[str], Optional[str]]:
     if not _HAVE_MUTAGEN:
         return None, None
     try:
-        m = MutagenFile(path, easy=True)
-        if not m:
-            return None, None
-        artist = None
-        title = None
-        for k in ("artist", "ARTIST", "TPE1"):
-            v = m.tags.get(k) if m.tags else None
-            if v:
+        st = os.stat(path)
+    except OSError:
+        return None, None
+    key = (path, st.st_mtime_ns, st.st_size)
+    hit = _TAG_CACHE.get(key)
+    if hit is not None:
+        _TAG_CACHE.move_to_end(key)
+        return hit
+    res = _read_tags(path)
+    _TAG_CACHE[key] = res
+    if len(_TAG_CACHE) > _TAG_CACHE_MAX:
+        _TAG_CACHE.popitem(last=False)
+    return res
+
+def _read_tags(path: str) -> Tuple[Optional[str], Optional[str]]:
+    for reader in _TAG_READERS:
+        try:
+            return _read_tags_with(reader, path)
+        except Exception:
+            # e.g. mutagen_rs with a diverging API: try the next reader
+            continue
+    return None, None
+
+def _read_tags_with(reader, path: str) -> Tuple[Optional[str], Optional[str]]:
+    m = reader(path, easy=True)
+    if not m:
+        return None, None
+    artist = None
+    title = None
+    # One pass over the tags, bucketing artist/title keys as they come
+    if m.tags:
+        for k, v in m.tags.items():
+            if not v:
+                continue
+            if artist is None and k in _ARTIST_KEYS:
                 artist = v[0] if isinstance(v, list) else v
-                break
-        for k in ("title", "TITLE", "TIT2"):
-            v = m.tags.get(k) if m.tags else None
-            if v:
+            elif title is None and k in _TITLE_KEYS:
                 title = v[0] if isinstance(v, list) else v
+            else:
+                continue
+            if artist is not None and title is not None:
                 break
-        return (_clean_piece(_ensure_str(artist)) or None,
-                _clean_piece(_ensure_str(title)) or None)
-    except Exception:
-        return None, None
+    return (_clean_piece(_ensure_str(artist)) or None,
+            _clean_piece(_ensure_str(title)) or None)
 
 def parse_artist_title_from_filename(path: str) -> Tuple[Optional[str], Optional[str]]:
     """
@@ -118,23 +169,19 @@ def parse_artist_title_from_filename(path: str) -> Tuple[Optional[str], Optional
     base = os.path.basename(path)
     stem = _strip_ext(base)
 
-    m = re.match(r"^\s*(.+?)\s*[-–—]\s*(.+?)\s*$", stem)
+    m = _FNAME_RE.match(stem)
     if m:
-        a, t = _clean_piece(m.group(1)), _clean_piece(m.group(2))
+        a, t = _clean_piece(m.group("a")), _clean_piece(m.group("t"))
         if a and t:
             return a, t
 
-    m = re.match(r"^\s*\d{1,3}\s*[-–—]\s*(.+?)\s*[-–—]\s*(.+?)\s*$", stem)
-    if m:
-        a, t = _clean_piece(m.group(1)), _clean_piece(m.group(2))
-        if a and t:
-            return a, t
-
-    parts = os.path.normpath(path).split(os.sep)
-    if len(parts) >= 3:
-        artist_guess = _clean_piece(parts[-3])
-        title_guess = _clean_piece(re.sub(r"^(?:[A-Za-z]?\d{1,3}[\s\.\-_]+)", "", stem))
-        if artist_guess and title_guess:
+    # Artist/Album/file: the grandparent directory names the artist
+    album_dir = os.path.normpath(path).rpartition(os.sep)[0]
+    artist_dir = album_dir.rpartition(os.sep)[0].rpartition(os.sep)[2]
+    artist_guess = _clean_piece(artist_dir)
+    if artist_guess:
+        title_guess = _clean_piece(_LEADING_TRACKNUM_RE.sub("", stem))
+        if title_guess:
             return artist_guess, title_guess
 
     return None, _clean_piece(stem) or None
@@ -147,54 +194,228 @@ class LyricsResult:
     text: str
     source: str
 
-def fetch_lyrics(artist: str, title: str) -> Optional[LyricsResult]:
-    if not _HAVE_REQUESTS or not artist or not title:
-        return None
+def read_sidecar(path: str) -> Optional[LyricsResult]:
+    """Lyrics from a .lrc/.txt file next to the media file, if present."""
+    stem, _ = os.path.splitext(path)
+    for cand in (Path(stem + ".lrc"), Path(stem + ".txt")):
+        try:
+            size = cand.stat().st_size  # also the existence check
+        except OSError:
+            continue
+        try:
+            if size > 65536:
+                # Large files: decode straight from the mapped pages
+                with open(cand, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    txt = mm[:].decode("utf-8", "replace")
+            else:
+                txt = cand.read_text(encoding="utf-8", errors="replace")
+            return LyricsResult(artist=None, title=None, text=txt, source=cand.name)
+        except Exception:
+            pass
+    return None
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+def _session():
+    """Shared keep-alive session, so track changes reuse the TCP/TLS connection."""
+    global _SESSION
+    if _SESSION is None:
+        # Provider threads start together; only one of them may build the session
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                s = requests.Session()
+                s.headers["User-Agent"] = LYRICS_USER_AGENT
+                try:
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+                    retry = Retry(total=1, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+                    s.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry))
+                except Exception:
+                    pass
+                _SESSION = s
+    return _SESSION
+
+# Provider outcomes: only FOUND and MISS are definitive answers worth caching
+FOUND, MISS, ERROR = "found", "miss", "error"
+
+def _fetch_lyrics_ovh(artist: str, title: str) -> Tuple[str, Optional[LyricsResult]]:
     try:
-        url = f"https://api.lyrics.ovh/v1/{artist}/{title}"
-        res = requests.get(url, timeout=LYRICS_TIMEOUT,
-                           headers={"User-Agent": LYRICS_USER_AGENT})
+        # Quote everything, so "/", "?", "#" and "&" stay inside their segment
+        url = f"https://api.lyrics.ovh/v1/{quote(artist, safe='')}/{quote(title, safe='')}"
+        res = _session().get(url, timeout=LYRICS_TIMEOUT)
+        if res.status_code == 404:
+            return MISS, None
         if res.status_code == 200:
-            lyrics = (res.json() or {}).get("lyrics", "") or ""
+            lyrics = res.json().get("lyrics") or ""
             if lyrics.strip():
-                return LyricsResult(artist=artist, title=title, text=lyrics, source="lyrics.ovh")
+                return FOUND, LyricsResult(artist=artist, title=title, text=lyrics, source="lyrics.ovh")
+            return MISS, None
+    except Exception:
+        pass
+    return ERROR, None
+
+def _fetch_lrclib(artist: str, title: str) -> Tuple[str, Optional[LyricsResult]]:
+    try:
+        res = _session().get("https://lrclib.net/api/get", timeout=LYRICS_TIMEOUT,
+                             params={"artist_name": artist, "track_name": title})
+        if res.status_code == 404:
+            return MISS, None
+        if res.status_code == 200:
+            data = res.json()
+            lyrics = data.get("plainLyrics") or data.get("syncedLyrics") or ""
+            if lyrics.strip():
+                return FOUND, LyricsResult(artist=artist, title=title, text=lyrics, source="lrclib.net")
+            return MISS, None
+    except Exception:
+        pass
+    return ERROR, None
+
+_PROVIDERS = (_fetch_lyrics_ovh, _fetch_lrclib)
+
+def fetch_lyrics(artist: str, title: str,
+                 is_stale: Optional[Callable[[], bool]] = None) -> Tuple[Optional[LyricsResult], bool]:
+    """
+    Query all providers in parallel; the first non-empty answer wins.
+    Returns (result, definitive): a None result is only definitive when every
+    provider answered "not found" (errors, timeouts and no 'requests' are not).
+    is_stale() is polled while waiting; once it returns True the call gives up.
+    """
+    if not _HAVE_REQUESTS or not artist or not title:
+        return None, False
+    artist, title = artist.strip(), title.strip()
+    # Names the API can't match anyway: don't spend a round trip on them
+    if not artist or not title or _CTRL_RE.search(artist) or _CTRL_RE.search(title):
+        return None, False
+    # Fresh daemon threads per call, so a hung request never blocks interpreter
+    # exit; the caller stops waiting as soon as its job is stale
+    answers: "queue.SimpleQueue[Tuple[str, Optional[LyricsResult]]]" = queue.SimpleQueue()
+    for fn in _PROVIDERS:
+        threading.Thread(target=lambda fn=fn: answers.put(fn(artist, title)),
+                         name="lyrics", daemon=True).start()
+    deadline = time.monotonic() + LYRICS_TIMEOUT + 1
+    misses = answered = 0
+    while answered < len(_PROVIDERS):
+        if is_stale is not None and is_stale():
+            return None, False  # skipped track or shutdown: leave the rest running
+        left = deadline - time.monotonic()
+        if left <= 0:
+            break  # deadline hit: not an answer, so not definitive
+        try:
+            # Short slices keep the staleness check responsive
+            status, res = answers.get(timeout=min(0.1, left))
+        except queue.Empty:
+            continue
+        answered += 1
+        if status == FOUND:
+            return res, True
+        if status == MISS:
+            misses += 1
+    return None, misses == len(_PROVIDERS)
+
+# -------- Persistent cache (artist/title -> lyrics) --------
+_DB = None
+_DB_LOCK = threading.Lock()
+
+def _cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "generic_player", "lyrics.sqlite")
+
+def _cache_db():
+    """Open the cache on first use (from the worker thread); None if unavailable."""
+    global _DB
+    if _DB is None:
+        path = _cache_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS lyrics (key TEXT PRIMARY KEY, text TEXT, source TEXT, ts REAL)")
+        _DB = db
+    return _DB
+
+def _cache_key(artist: str, title: str) -> str:
+    raw = (artist.lower() + "\x1f" + title.lower()).encode("utf-8", "replace")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def cache_get(artist: str, title: str) -> Tuple[bool, Optional[LyricsResult]]:
+    """Return (hit, result). A hit with result None is a remembered miss."""
+    try:
+        with _DB_LOCK:
+            row = _cache_db().execute(
+                "SELECT text, source, ts FROM lyrics WHERE key=?", (_cache_key(artist, title),)
+            ).fetchone()
+    except Exception:
+        return False, None
+    if not row:
+        return False, None
+    text, source, ts = row
+    if not text:
+        return (time.time() - (ts or 0)) < LYRICS_MISS_TTL, None
+    return True, LyricsResult(artist=artist, title=title, text=text, source=source or "cache")
+
+def cache_put(artist: str, title: str, res: Optional[LyricsResult]) -> None:
+    try:
+        with _DB_LOCK:
+            db = _cache_db()
+            db.execute(
+                "INSERT OR REPLACE INTO lyrics (key, text, source, ts) VALUES (?, ?, ?, ?)",
+                (_cache_key(artist, title), res.text if res else "", res.source if res else "", time.time()),
+            )
+            db.commit()
     except Exception:
         pass
-    return None
 
-# -------- Worker (emits job_id + result) --------
+# -------- Worker (long-lived; emits job_id + result) --------
 class _LyricsWorker(QtCore.QObject):
     finished = pyqtSignal(int, object)  # job_id, LyricsResult | None
 
-    def __init__(self, job_id: int, path: Optional[str], artist: Optional[str], title: Optional[str]):
+    def __init__(self):
         super().__init__()
-        self.job_id = job_id
-        self.path = path
-        self.artist = artist
-        self.title = title
+        # Newest job id, set from the GUI thread; queued older jobs are skipped
+        self.latest_job = 0
+
+    @QtCore.pyqtSlot(int, object, object, object)
+    def submit(self, job_id: int, path: Optional[str], artist: Optional[str], title: Optional[str]):
+        if job_id != self.latest_job:
+            return
 
-    @QtCore.pyqtSlot()
-    def run(self):
-        a, t = self.artist, self.title
+        # 0) sidecar file (read here so slow mounts never block the GUI thread)
+        if path:
+            res = read_sidecar(path)
+            if res:
+                self.finished.emit(job_id, res)
+                return
+
+        a, t = artist, title
 
         # 1) tags
-        if (not a or not t) and self.path:
-            ta, tt = parse_artist_title_from_tags(self.path)
+        if (not a or not t) and path:
+            ta, tt = parse_artist_title_from_tags(path)
             a = a or ta
             t = t or tt
 
         # 2) filename patterns
-        if (not a or not t) and self.path:
-            fa, ft = parse_artist_title_from_filename(self.path)
+        if (not a or not t) and path:
+            fa, ft = parse_artist_title_from_filename(path)
             a = a or fa
             t = t or ft
 
-        # 3) online fetch
-        result = fetch_lyrics(a, t) if (a and t) else None
-        self.finished.emit(self.job_id, result)
+        # 3) local cache, then online fetch
+        result = None
+        if a and t:
+            hit, result = cache_get(a, t)
+            if not hit:
+                result, definitive = fetch_lyrics(a, t, lambda: job_id != self.latest_job)
+                # Errors/timeouts are retried next time instead of remembered as misses
+                if definitive:
+                    cache_put(a, t, result)
+        self.finished.emit(job_id, result)
 
 # -------- Controller --------
 class GenericPlayerLyrics(QtCore.QObject):
+    _submit = pyqtSignal(int, object, object, object)  # job_id, path, artist, title
+
     def __init__(self, main_window: QtWidgets.QMainWindow, video_widget: Optional[QtWidgets.QWidget] = None):
         super().__init__(main_window)
         self.win = main_window
@@ -220,10 +441,15 @@ class GenericPlayerLyrics(QtCore.QObject):
         except Exception:
             pass
 
-        # Thread state
-        self._thread: Optional[QtCore.QThread] = None
-        self._worker: Optional[_LyricsWorker] = None
+        # One worker thread for the panel's lifetime; jobs are queued to it
         self._job_id = 0  # monotonically increasing
+        self._thread = QtCore.QThread(self)
+        self._worker = _LyricsWorker()
+        self._worker.moveToThread(self._thread)
+        self._submit.connect(self._worker.submit)
+        self._worker.finished.connect(self._on_ready, QtCore.Qt.ConnectionType.QueuedConnection if USING_QT6 else QtCore.Qt.QueuedConnection)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.start()
 
         # Initial UI
         if not _HAVE_REQUESTS:
@@ -268,42 +494,13 @@ class GenericPlayerLyrics(QtCore.QObject):
         """Called by player when a new local file starts."""
         self._cancel_job()
 
-        # Sidecar first
-        if path:
-            stem, _ = os.path.splitext(path)
-            for cand in (stem + ".lrc", stem + ".txt"):
-                if os.path.exists(cand):
-                    try:
-                        txt = open(cand, "r", encoding="utf-8", errors="replace").read()
-                        self._set_text(txt, source=os.path.basename(cand))
-                        return
-                    except Exception:
-                        pass
-
-        if not _HAVE_REQUESTS:
-            self.view.setHtml("<b>Lyrics:</b> <i>Install 'requests' to enable online fetching.</i>")
-            return
-
+        # Sidecar lookup happens in the worker, ahead of tags/online fetch
         self.view.setHtml("<i>Fetching lyrics…</i>")
 
         # New job
         self._job_id += 1
-        job_id = self._job_id
-
-        thread = QtCore.QThread(self)
-        worker = _LyricsWorker(job_id, path, artist, title)
-        worker.moveToThread(thread)
-
-        # Wire up using local 'thread' variable to avoid referencing self._thread later
-        thread.started.connect(worker.run)
-        worker.finished.connect(self._on_ready, QtCore.Qt.ConnectionType.QueuedConnection if USING_QT6 else QtCore.Qt.QueuedConnection)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        thread.finished.connect(thread.deleteLater)
-
-        self._thread = thread
-        self._worker = worker
-        thread.start()
+        self._worker.latest_job = self._job_id
+        self._submit.emit(self._job_id, path, artist, title)
 
     def clear(self):
         self._cancel_job()
@@ -323,40 +520,15 @@ class GenericPlayerLyrics(QtCore.QObject):
             src = f"<div style='color:#74808a;font-size:11px'>Source: {_html_escape(res.source)}</div>"
             body = f"<pre style='white-space:pre-wrap;margin:0'>{_html_escape(res.text)}</pre>"
             self.view.setHtml(header + body + src)
+        elif not _HAVE_REQUESTS:
+            self.view.setHtml("<b>Lyrics:</b> <i>Install 'requests' to enable online fetching.</i>")
         else:
-            self.view.setHtml("<i>No lyrics found (tried tags, filename and lyrics.ovh).</i>")
-
-    def _set_text(self, text: str, source: Optional[str] = None):
-        src = f"<div style='color:#74808a;font-size:11px'>Source: {_html_escape(source)}</div>" if source else ""
-        self.view.setHtml(f"<pre style='white-space:pre-wrap;margin:0'>{_html_escape(text)}</pre>{src}")
+            self.view.setHtml("<i>No lyrics found (tried tags, filename, lyrics.ovh and lrclib.net).</i>")
 
     def _cancel_job(self):
-        """Stop any running worker safely (no dangling signal calls)."""
-        t, w = self._thread, self._worker
-        self._thread = None
-        self._worker = None
-        # Bump job id so any late results are ignored
+        """Invalidate the current job; late or still-queued results are ignored."""
         self._job_id += 1
-
-        if t:
-            try:
-                # RequestInterruption is best-effort; worker is short-lived anyway
-                if hasattr(t, "requestInterruption"):
-                    t.requestInterruption()
-            except Exception:
-                pass
-            try:
-                t.quit()
-            except Exception:
-                pass
-            try:
-                t.wait(1500)  # wait up to 1.5s to finish
-            except Exception:
-                pass
-            try:
-                t.deleteLater()
-            except Exception:
-                pass
+        self._worker.latest_job = self._job_id
 
     def shutdown(self):
         """Called by main window on exit to avoid QThread abort."""
@@ -364,6 +536,13 @@ class GenericPlayerLyrics(QtCore.QObject):
             self._cancel_job()
         except Exception:
             pass
+        t = self._thread
+        if t is not None:
+            try:
+                t.quit()
+                t.wait(1500)  # wait up to 1.5s for an in-flight fetch
+            except Exception:
+                pass
         try:
             self.dock.hide()
         except Exception:
@@ -6,11 +6,14 @@
 #   - Correct object path: /org/mpris/MediaPlayer2 (playerctl/DE requirement)
 #   - Proper a{sv} Metadata values (GLib.Variant) to avoid GetAll() TypeError
 #   - Metadata for local files so desktop shows track info
-#   - Non-blocking GLib integration via poll() (Qt drives via QTimer)
+#   - Event-driven DBus dispatch through Qt's GLib event loop
+#     (QTimer-driven poll() only as a fallback for non-GLib Qt builds)
 #   - Optional PropertiesChanged helpers for snappy OSD updates
 # ------------------------------------------------------------
 
+import functools
 import os
+import re
 import time
 
 import gi
@@ -21,18 +24,98 @@ from gi.repository import GLib
 from pydbus import SessionBus
 
 try:
-    from PyQt6.QtCore import QUrl, QTimer
+    from PyQt6.QtCore import QUrl, QTimer, QAbstractEventDispatcher
     from PyQt6.QtMultimedia import QMediaPlayer
     USING_QT6 = True
 except Exception:
-    from PyQt5.QtCore import QUrl, QTimer
+    from PyQt5.QtCore import QUrl, QTimer, QAbstractEventDispatcher
     from PyQt5.QtMultimedia import QMediaPlayer
     USING_QT6 = False
 
+# Qt playback state -> MPRIS PlaybackStatus (anything else is "Stopped")
+if USING_QT6:
+    _STATUS_BY_STATE = {
+        QMediaPlayer.PlaybackState.PlayingState: "Playing",
+        QMediaPlayer.PlaybackState.PausedState: "Paused",
+    }
+else:
+    _STATUS_BY_STATE = {
+        QMediaPlayer.State.PlayingState: "Playing",
+        QMediaPlayer.State.PausedState: "Paused",
+    }
+
+
+# "Artist - Title" display strings (hyphen, en dash or em dash)
+_DISPLAY_SEP_RE = re.compile(r"\s[-–—]\s")
+
+
+# Shared result when there is no track; never mutated
+_EMPTY_MD: dict = {}
+
+
+def _pack_str(v):
+    return GLib.Variant("s", "" if v is None else str(v))
+
+
+def _pack_str_list(v):
+    if v is None:
+        return GLib.Variant("as", [])
+    if isinstance(v, (list, tuple)):
+        return GLib.Variant("as", [str(x) for x in v])
+    return GLib.Variant("as", [str(v)])
+
+
+def _pack_fallback(v):
+    """Signature from the Python type, for keys without a fixed one."""
+    if isinstance(v, bool):
+        return GLib.Variant("b", v)
+    if isinstance(v, int):
+        return GLib.Variant("x", v)
+    if isinstance(v, float):
+        return GLib.Variant("d", v)
+    if isinstance(v, (list, tuple)):
+        return GLib.Variant("as", [str(x) for x in v])
+    return _pack_str(v)
+
+
+# Known MPRIS/xesam keys -> packer for their spec signature
+_MD_SIG = {
+    "mpris:trackid": lambda v: GLib.Variant("o", str(v)),
+    "mpris:length": lambda v: GLib.Variant("x", int(v)),
+    "xesam:title": _pack_str,
+    "xesam:url": _pack_str,
+    "xesam:album": _pack_str,
+    "xesam:artist": _pack_str_list,
+}
+
+
+def _pack_metadata(md_plain: dict) -> dict:
+    """Wrap plain metadata values in GLib.Variants for the a{sv} signature."""
+    md: dict = {}
+    for k, v in md_plain.items():
+        try:
+            md[k] = _MD_SIG.get(k, _pack_fallback)(v)
+        except Exception:
+            pass
+    return md
+
+
+@functools.lru_cache(maxsize=64)
+def _file_url(path: str) -> str:
+    """file:// URL for a local path (memoized; the playlist repeats paths)."""
+    try:
+        return QUrl.fromLocalFile(path).toString()
+    except Exception:
+        return str(path)
+
 
 class GenericPlayerMPRIS:
     """MPRIS2 bridge for Generic Player."""
 
+    # Fallback poll: back off to this interval after this many idle polls
+    POLL_IDLE_MS = 250
+    POLL_IDLE_AFTER = 10
+
     # Introspection XML for pydbus.
     dbus = """
     <node>
@@ -81,7 +164,19 @@ class GenericPlayerMPRIS:
 
         # Forced status (for instant OSD response). Cleared on real Qt state change.
         self._forced_playback_status = None
-        self._forced_until = 0.0
+        self._forced_until_ns = 0
+        # Last forced write, to skip repeats of the same status
+        self._last_forced_status = None
+        self._last_force_ns = 0
+
+        # Packed Metadata, reused until the inputs it was built from change
+        self._md_cache_key = None
+        self._md_cache = {}
+
+        # Values last broadcast via PropertiesChanged (unchanged ones are skipped)
+        self._last_emitted_status = None
+        self._last_emitted_volume = None
+        self._last_emitted_md = None
 
         # Publish with explicit object path.
         self.bus.publish(
@@ -89,32 +184,79 @@ class GenericPlayerMPRIS:
             (self.OBJ_PATH, self),
         )
 
-        # Non-blocking GLib integration (Qt drives poll() via QTimer)
+        # GLib integration: Qt's GLib dispatcher (if any) already iterates this
+        # context; otherwise start() falls back to pumping it via poll().
         self._glib_context = GLib.MainContext.default()
+        self._qt_timer = None
+        self._poll_busy_ms = 80
+        self._idle_polls = 0
+        self._qt_drives_glib = self.qt_drives_glib()
+
+    @staticmethod
+    def qt_drives_glib() -> bool:
+        """Return True if the Qt event loop runs on top of GLib.
+
+        Qt on Linux normally uses QEventDispatcherGlib, which dispatches the
+        default GLib main context as part of the Qt event loop. DBus calls are
+        then delivered as they arrive, with no extra wakeups from our side.
+        """
+        try:
+            disp = QAbstractEventDispatcher.instance()
+            name = disp.metaObject().className() if disp is not None else ""
+            return "glib" in str(name).lower()
+        except Exception:
+            return False
 
-    def start(self, interval_ms: int = 30):
-        """Start Qt-driven polling (backward compatibility).
+    def start(self, interval_ms: int = 80):
+        """Hook DBus dispatch into the Qt event loop.
 
-        Generic Player can either drive :meth:`poll` itself (recommended) or call this.
+        Nothing to do when Qt already drives GLib; otherwise fall back to
+        polling the GLib context from a QTimer (e.g. QT_NO_GLIB=1). The
+        timer runs at interval_ms while DBus is active and slows to
+        POLL_IDLE_MS when idle.
         """
+        if self._qt_drives_glib:
+            return
         try:
+            self._poll_busy_ms = int(interval_ms)
             self._qt_timer = QTimer(self.app)
             self._qt_timer.timeout.connect(self.poll)
-            self._qt_timer.start(int(interval_ms))
+            self._qt_timer.start(self._poll_busy_ms)
         except Exception:
             pass
 
     def poll(self):
         """Pump DBus without blocking Qt."""
+        # Under the GLib dispatcher, iterating here would re-enter Qt's own
+        # sources (timers, posted events) from inside a slot.
+        if self._qt_drives_glib:
+            return
+        busy = False
         try:
             while self._glib_context.pending():
                 self._glib_context.iteration(False)
+                busy = True
         except Exception:
             pass
 
+        # Adapt the fallback timer: fast right after traffic, slow when idle
+        t = self._qt_timer
+        if t is None:
+            return
+        if busy:
+            self._idle_polls = 0
+            want = self._poll_busy_ms
+        else:
+            self._idle_polls += 1
+            if self._idle_polls < self.POLL_IDLE_AFTER:
+                return
+            want = max(self._poll_busy_ms, self.POLL_IDLE_MS)
+        if t.interval() != want:
+            t.setInterval(want)
+
     def stop(self):
         try:
-            if hasattr(self, "_qt_timer") and self._qt_timer is not None:
+            if self._qt_timer is not None:
                 self._qt_timer.stop()
         except Exception:
             pass
@@ -199,8 +341,14 @@ class GenericPlayerMPRIS:
             s = str(status)
             if s not in ("Playing", "Paused", "Stopped"):
                 return
+            now = time.monotonic_ns()
+            # Same status forced moments ago: DE already has it, skip the DBus write
+            if s == self._last_forced_status and (now - self._last_force_ns) < 500_000_000:
+                return
+            self._last_forced_status = s
+            self._last_force_ns = now
             self._forced_playback_status = s
-            self._forced_until = time.monotonic() + max(0.0, float(timeout_ms) / 1000.0)
+            self._forced_until_ns = now + max(0, int(timeout_ms)) * 1_000_000
             self.notify_playback()
         except Exception:
             pass
@@ -208,84 +356,55 @@ class GenericPlayerMPRIS:
     def clear_forced_playback_status(self):
         try:
             self._forced_playback_status = None
-            self._forced_until = 0.0
+            self._forced_until_ns = 0
+            self._last_forced_status = None
         except Exception:
             pass
 
     # ---------------- Properties ----------------
     @property
     def PlaybackStatus(self):
+        if self._forced_playback_status and time.monotonic_ns() < self._forced_until_ns:
+            return self._forced_playback_status
         try:
-            if self._forced_playback_status and time.monotonic() < float(self._forced_until):
-                return str(self._forced_playback_status)
-        except Exception:
-            pass
-
-        try:
-            if USING_QT6:
-                state = self.app.player.playbackState()
-                return {
-                    QMediaPlayer.PlaybackState.PlayingState: "Playing",
-                    QMediaPlayer.PlaybackState.PausedState: "Paused",
-                }.get(state, "Stopped")
-            else:
-                state = self.app.player.state()
-                return {
-                    QMediaPlayer.State.PlayingState: "Playing",
-                    QMediaPlayer.State.PausedState: "Paused",
-                }.get(state, "Stopped")
+            p = self.app.player
+            return _STATUS_BY_STATE.get(p.playbackState() if USING_QT6 else p.state(), "Stopped")
         except Exception:
             return "Stopped"
 
     @property
     def Metadata(self):
-        """Return MPRIS Metadata as a{sv}.
+        """Return MPRIS Metadata as a{sv} (cached per track/duration)."""
+        key = self._metadata_key()
+        if key != self._md_cache_key:
+            self._md_cache = self._build_metadata()
+            self._md_cache_key = key
+        return self._md_cache
+
+    def _metadata_key(self):
+        """Everything _build_metadata() reads from the app."""
+        idx = getattr(self.app, "current_song_index", -1)
+        playlist = getattr(self.app, "playlist", []) or []
+        item = (playlist[idx] or {}) if 0 <= idx < len(playlist) else {}
+        return (
+            getattr(self.app, "current_radio", None), idx,
+            item.get("path"), item.get("title"), item.get("artist"), item.get("display"),
+            getattr(self.app, "_duration_ms", 0),
+        )
+
+    def _build_metadata(self):
+        """Build MPRIS Metadata as a{sv}.
 
         IMPORTANT: For the `a{sv}` signature, each dict value must be a
         GLib.Variant (because value type is 'v').
         """
 
-        def V(sig: str, val):
-            return GLib.Variant(sig, val)
-
-        def pack(md_plain: dict) -> dict:
-            md: dict = {}
-            for k, v in (md_plain or {}).items():
-                try:
-                    if k == "mpris:trackid":
-                        md[k] = V("o", str(v))
-                    elif k in ("xesam:title", "xesam:url", "xesam:album"):
-                        md[k] = V("s", "" if v is None else str(v))
-                    elif k == "xesam:artist":
-                        if v is None:
-                            md[k] = V("as", [])
-                        elif isinstance(v, (list, tuple)):
-                            md[k] = V("as", [str(x) for x in v])
-                        else:
-                            md[k] = V("as", [str(v)])
-                    elif k == "mpris:length":
-                        md[k] = V("x", int(v))
-                    else:
-                        if isinstance(v, bool):
-                            md[k] = V("b", bool(v))
-                        elif isinstance(v, int):
-                            md[k] = V("x", int(v))
-                        elif isinstance(v, float):
-                            md[k] = V("d", float(v))
-                        elif isinstance(v, (list, tuple)):
-                            md[k] = V("as", [str(x) for x in v])
-                        else:
-                            md[k] = V("s", "" if v is None else str(v))
-                except Exception:
-                    pass
-            return md
-
         # --- Radio metadata ---
         station = getattr(self.app, "current_radio", None)
         stations = getattr(self.app, "radio_stations", {}) or {}
         if station:
             url = stations.get(station, "")
-            return pack({
+            return _pack_metadata({
                 "mpris:trackid": f"{self.OBJ_PATH}/track/radio",
                 "xesam:title": station,
                 "xesam:artist": ["Radio"],
@@ -296,7 +415,7 @@ class GenericPlayerMPRIS:
         idx = getattr(self.app, "current_song_index", -1)
         playlist = getattr(self.app, "playlist", []) or []
         if not (0 <= idx < len(playlist)):
-            return pack({})
+            return _EMPTY_MD
 
         item = playlist[idx] or {}
         path = item.get("path", "")
@@ -308,15 +427,13 @@ class GenericPlayerMPRIS:
 
         # If only display is available, try to split it.
         if (not title or not artist) and isinstance(display, str):
-            for sep in (" — ", " - ", " – ", " — "):
-                if sep in display:
-                    a, t = display.split(sep, 1)
-                    a, t = a.strip(), t.strip()
-                    if not artist and a:
-                        artist = a
-                    if not title and t:
-                        title = t
-                    break
+            parts = _DISPLAY_SEP_RE.split(display, maxsplit=1)
+            if len(parts) == 2:
+                a, t = parts[0].strip(), parts[1].strip()
+                if not artist and a:
+                    artist = a
+                if not title and t:
+                    title = t
 
         if not title:
             title = os.path.basename(path) or "Unknown"
@@ -332,32 +449,23 @@ class GenericPlayerMPRIS:
         }
 
         if path:
-            try:
-                md_plain["xesam:url"] = QUrl.fromLocalFile(path).toString()
-            except Exception:
-                md_plain["xesam:url"] = str(path)
+            md_plain["xesam:url"] = _file_url(path)
 
         if length_us > 0:
             md_plain["mpris:length"] = length_us
 
-        return pack(md_plain)
+        return _pack_metadata(md_plain)
 
     @property
     def Volume(self):
         # MPRIS volume is 0.0..1.0
         try:
-            if hasattr(self.app, "audio_out") and self.app.audio_out is not None:
-                return float(self.app.audio_out.volume())
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self.app, "volume_slider") and self.app.volume_slider is not None:
-                return float(self.app.volume_slider.value()) / 100.0
-        except Exception:
-            pass
-
-        try:
+            ao = getattr(self.app, "audio_out", None)
+            if ao is not None:
+                return float(ao.volume())
+            vs = getattr(self.app, "volume_slider", None)
+            if vs is not None:
+                return float(vs.value()) / 100.0
             return float(self.app.player.volume()) / 100.0
         except Exception:
             return 0.7
@@ -397,31 +505,20 @@ class GenericPlayerMPRIS:
 
     @property
     def CanGoNext(self):
-        try:
-            if getattr(self.app, "current_radio", None):
-                return False
-            return bool(getattr(self.app, "playlist", []))
-        except Exception:
-            return True
+        if getattr(self.app, "current_radio", None):
+            return False
+        return bool(getattr(self.app, "playlist", None))
 
     @property
     def CanGoPrevious(self):
-        try:
-            if getattr(self.app, "current_radio", None):
-                return False
-            return bool(getattr(self.app, "playlist", []))
-        except Exception:
-            return True
+        return self.CanGoNext
 
     CanPlay = True
     CanPause = True
 
     @property
     def CanSeek(self):
-        try:
-            return getattr(self.app, "current_radio", None) is None
-        except Exception:
-            return True
+        return getattr(self.app, "current_radio", None) is None
 
     CanControl = True
 
@@ -429,6 +526,9 @@ class GenericPlayerMPRIS:
     def _emit_properties_changed(self, changed: dict, invalidated=None):
         """Emit org.freedesktop.DBus.Properties.PropertiesChanged."""
         try:
+            # Nobody can receive it once the session bus is gone (e.g. logout)
+            if self.bus.con.is_closed():
+                return
             inv = invalidated or []
             params = GLib.Variant("(sa{sv}as)", (self.PLAYER_IFACE, changed, inv))
             # Gio.DBusConnection.emit_signal(destination, path, iface, signal, params)
@@ -444,8 +544,12 @@ class GenericPlayerMPRIS:
 
     def notify_playback(self):
         try:
+            status = self.PlaybackStatus
+            if status == self._last_emitted_status:
+                return
+            self._last_emitted_status = status
             self._emit_properties_changed({
-                "PlaybackStatus": GLib.Variant("s", self.PlaybackStatus)
+                "PlaybackStatus": GLib.Variant("s", status)
             })
         except Exception:
             pass
@@ -453,6 +557,10 @@ class GenericPlayerMPRIS:
     def notify_metadata(self):
         try:
             md = self.Metadata
+            # The Metadata cache hands back the same dict until it is rebuilt
+            if md is self._last_emitted_md:
+                return
+            self._last_emitted_md = md
             self._emit_properties_changed({
                 "Metadata": GLib.Variant("a{sv}", md)
             })
@@ -461,8 +569,13 @@ class GenericPlayerMPRIS:
 
     def notify_volume(self):
         try:
+            vol = float(self.Volume)
+            last = self._last_emitted_volume
+            if last is not None and abs(vol - last) < 1e-3:
+                return
+            self._last_emitted_volume = vol
             self._emit_properties_changed({
-                "Volume": GLib.Variant("d", float(self.Volume))
+                "Volume": GLib.Variant("d", vol)
             })
         except Exception:
             pass
@@ -478,21 +591,16 @@ class GenericPlayerMPRIS:
 
     def _is_playing(self) -> bool:
         # Prefer the app's last confirmed state (Qt signal-driven), if available.
-        try:
-            return bool(getattr(self.app, "_last_playing", False))
-        except Exception:
-            pass
+        last = getattr(self.app, "_last_playing", None)
+        if last is not None:
+            return bool(last)
 
         # Fall back to querying the player directly.
-        fn = getattr(self.app, "player_is_playing", None)
-        if callable(fn):
-            try:
-                return bool(fn())
-            except Exception:
-                pass
         try:
-            if USING_QT6:
-                return self.app.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
-            return self.app.player.state() == QMediaPlayer.State.PlayingState
+            fn = getattr(self.app, "player_is_playing", None)
+            if callable(fn):
+                return bool(fn())
+            p = self.app.player
+            return _STATUS_BY_STATE.get(p.playbackState() if USING_QT6 else p.state()) == "Playing"
         except Exception:
             return False